@@ -3,59 +3,97 @@ Configuration settings for the application.
 """
 
 import os
-from pydantic import BaseSettings
 import uuid
+from functools import cached_property
+from typing import Final
+
+import jwt
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """
     Application settings.
+
+    Env resolution is handled by pydantic-settings at construction;
+    rarely-used secrets are cached_property so they are only resolved on
+    first access instead of at cold start.
     """
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
     # JWT settings
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key")
-    JWT_REFRESH_SECRET_KEY: str = os.getenv("JWT_REFRESH_SECRET_KEY", "your-refresh-secret-key")
+    JWT_SECRET_KEY: str = "your-secret-key"
+    JWT_REFRESH_SECRET_KEY: str = "your-refresh-secret-key"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
-    
+
     # Database settings
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///backend/records.db")
-    
+    DATABASE_URL: str = "sqlite:///backend/records.db"
+
     # Default tenant settings
     DEFAULT_TENANT_ID: uuid.UUID = uuid.UUID("00000000-0000-0000-0000-000000000001")
-    
+
     # Storage settings
-    STORAGE_PATH: str = os.getenv("STORAGE_PATH", "storage")
-    
+    STORAGE_PATH: str = "storage"
+
     # Whisper settings
-    WHISPER_MODEL_DIR: str = os.getenv("WHISPER_MODEL_DIR", "models/whisper")
-    FASTER_WHISPER_MODEL_DIR: str = os.getenv("FASTER_WHISPER_MODEL_DIR", "models/faster-whisper")
-    INSANELY_FAST_WHISPER_MODEL_DIR: str = os.getenv("INSANELY_FAST_WHISPER_MODEL_DIR", "models/insanely-fast-whisper")
-    
+    WHISPER_MODEL_DIR: str = "models/whisper"
+    FASTER_WHISPER_MODEL_DIR: str = "models/faster-whisper"
+    INSANELY_FAST_WHISPER_MODEL_DIR: str = "models/insanely-fast-whisper"
+
     # VAD settings
-    VAD_MODEL_DIR: str = os.getenv("VAD_MODEL_DIR", "models/vad")
-    
+    VAD_MODEL_DIR: str = "models/vad"
+
     # BGM separation settings
-    UVR_MODEL_DIR: str = os.getenv("UVR_MODEL_DIR", "models/uvr")
-    
+    UVR_MODEL_DIR: str = "models/uvr"
+
     # Output settings
-    OUTPUT_DIR: str = os.getenv("OUTPUT_DIR", "outputs")
-    
+    OUTPUT_DIR: str = "outputs"
+
     # Cache settings
-    CACHE_DIR: str = os.getenv("CACHE_DIR", "backend/cache")
-    CACHE_TTL: int = int(os.getenv("CACHE_TTL", "86400"))  # 24 hours
-    CACHE_FREQUENCY: int = int(os.getenv("CACHE_FREQUENCY", "3600"))  # 1 hour
-    
+    CACHE_DIR: str = "backend/cache"
+    CACHE_TTL: int = 86400  # 24 hours
+    CACHE_FREQUENCY: int = 3600  # 1 hour
+
     # Server settings
-    SERVER_PORT: int = int(os.getenv("SERVER_PORT", "8000"))
-    SERVER_HOST: str = os.getenv("SERVER_HOST", "0.0.0.0")
-    
-    # RevenueCat settings
-    REVENUECAT_API_KEY: str = os.getenv("REVENUECAT_API_KEY", "")
-    REVENUECAT_WEBHOOK_SECRET: str = os.getenv("REVENUECAT_WEBHOOK_SECRET", "")
-    
-    class Config:
-        env_file = ".env"
+    SERVER_PORT: int = 8000
+    SERVER_HOST: str = "0.0.0.0"
+
+    # Job queue settings
+    MAX_TENANT_QUEUE_DEPTH: int = 1000
+
+    # RevenueCat settings (lazy: only resolved when billing code touches them)
+    @cached_property
+    def REVENUECAT_API_KEY(self) -> str:
+        return os.getenv("REVENUECAT_API_KEY", "")
+
+    @cached_property
+    def REVENUECAT_WEBHOOK_SECRET(self) -> str:
+        return os.getenv("REVENUECAT_WEBHOOK_SECRET", "")
 
 
 settings = Settings()
+
+# Module-level constants for hot paths: a plain global lookup is cheaper than
+# going through Pydantic's attribute machinery on every access.
+JWT_SECRET_KEY: Final[str] = settings.JWT_SECRET_KEY
+JWT_REFRESH_SECRET_KEY: Final[str] = settings.JWT_REFRESH_SECRET_KEY
+JWT_ALGORITHM: Final[str] = settings.JWT_ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES: Final[int] = settings.ACCESS_TOKEN_EXPIRE_MINUTES
+REFRESH_TOKEN_EXPIRE_DAYS: Final[int] = settings.REFRESH_TOKEN_EXPIRE_DAYS
+DEFAULT_TENANT_ID: Final[uuid.UUID] = settings.DEFAULT_TENANT_ID
+STORAGE_PATH: Final[str] = settings.STORAGE_PATH
+CACHE_TTL: Final[int] = settings.CACHE_TTL
+CACHE_FREQUENCY: Final[int] = settings.CACHE_FREQUENCY
+MAX_TENANT_QUEUE_DEPTH: Final[int] = settings.MAX_TENANT_QUEUE_DEPTH
+
+# Verification key prepared once at import. For HMAC this is just the
+# encoded secret; for asymmetric algorithms it would otherwise be a PEM
+# parse on every jwt.decode call.
+JWT_PREPARED_KEY: Final = jwt.algorithms.get_default_algorithms()[
+    JWT_ALGORITHM
+].prepare_key(JWT_SECRET_KEY)
+JWT_REFRESH_PREPARED_KEY: Final = jwt.algorithms.get_default_algorithms()[
+    JWT_ALGORITHM
+].prepare_key(JWT_REFRESH_SECRET_KEY)
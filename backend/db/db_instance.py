@@ -1,7 +1,9 @@
 import functools
 import os
+
+import orjson
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from functools import wraps
 from sqlalchemy.exc import SQLAlchemyError
 from fastapi import HTTPException
@@ -14,7 +16,33 @@ from backend.common.config_loader import read_env
 @functools.lru_cache
 def init_db():
     db_url = read_env("DB_URL", "sqlite:///backend/records.db")
-    engine = create_engine(db_url, connect_args={"check_same_thread": False})
+
+    if db_url.startswith("sqlite"):
+        connect_args = {"check_same_thread": False}
+        engine_kwargs = {}
+    else:
+        # Size the pool to the worker count so handlers don't stall waiting
+        # for a free connection under load.
+        connect_args = {}
+        pool_size = int(read_env("DB_POOL_SIZE", "10"))
+        engine_kwargs = {
+            "pool_size": pool_size,
+            "max_overflow": 2 * pool_size,
+        }
+
+    engine = create_engine(
+        db_url,
+        connect_args=connect_args,
+        # orjson handles the JSON columns (branding theme/assets/texts,
+        # plan features, job params) instead of the stdlib encoder
+        json_serializer=lambda obj: orjson.dumps(obj).decode(),
+        json_deserializer=orjson.loads,
+        # The generic tenant helpers multiply distinct statement shapes
+        # by model class; a larger compiled-statement cache keeps them
+        # all resident (default is 500)
+        query_cache_size=1200,
+        **engine_kwargs,
+    )
     SQLModel.metadata.create_all(engine)
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -24,6 +52,16 @@ def get_db_session():
     return db_instance()
 
 
+@functools.lru_cache
+def get_scoped_session():
+    """Thread-local session registry for long-lived worker threads.
+
+    Call `get_scoped_session()()` to get the thread's session and
+    `get_scoped_session().remove()` when the thread exits.
+    """
+    return scoped_session(init_db())
+
+
 def handle_database_errors(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
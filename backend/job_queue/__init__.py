@@ -2,7 +2,7 @@
 Job Queue package for multi-tenant transcription processing.
 """
 
-from .queue_manager import job_queue, start_job_queue, stop_job_queue, enqueue_job, register_handler
+from .queue_manager import job_queue, start_job_queue, stop_job_queue, enqueue_job, register_handler, QueueFullError
 from .websocket_manager import connection_manager
 
 __all__ = [
@@ -11,5 +11,6 @@ __all__ = [
     "stop_job_queue",
     "enqueue_job",
     "register_handler",
+    "QueueFullError",
     "connection_manager"
 ]
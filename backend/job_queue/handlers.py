@@ -3,47 +3,179 @@ Job handlers for processing different types of jobs.
 """
 
 import asyncio
-import json
+import concurrent.futures
+import functools
 import logging
 import os
 import time
 import uuid
-from datetime import datetime
 from typing import Dict, Any
 
-from backend.db.db_instance import get_db_session
-from backend.models.workflow import Job
+import orjson
+
 from backend.utils.tenant_utils import get_tenant_storage_path
+from backend.job_queue.queue_manager import JobPayload, JobResult
 from backend.job_queue.websocket_manager import connection_manager
-from backend.routers.transcription.router import get_pipeline
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Mapping from workflow node data keys to pipeline parameter names
+_PARAM_MAP = {
+    "modelSize": "model_size",
+    "whisperType": "whisper_type",
+    "language": "language",
+    "computeType": "compute_type",
+    "vad": "vad",
+    "diarization": "diarization"
+}
+
+# Pipeline loaded once per pool worker process, so transcription's
+# Python-level pre/post-processing runs outside the server's GIL.
+_worker_pipeline = None
+
 
-async def transcription_handler(job_data: Dict[str, Any], tenant_id: uuid.UUID):
+class ProgressThrottle:
     """
-    Handler for transcription jobs.
-    
+    Coalesce progress updates to at most `hz` messages per second.
+
+    Rapid update() calls overwrite the pending value and share a single
+    scheduled flush, so a segment-level progress source cannot flood the
+    WebSocket with one broadcast per segment.
+    """
+
+    def __init__(self, send, hz: int = 10):
+        """
+        Initialize the throttle.
+
+        Args:
+            send: Async callable invoked with the latest progress value
+            hz: Maximum number of sends per second
+        """
+        self._send = send
+        self._interval = 1.0 / hz
+        self._pending = None
+        self._last_sent = None
+        self._task = None
+
+    async def update(self, progress: float):
+        """
+        Record a progress value, scheduling a coalesced send.
+
+        Args:
+            progress: Progress value to broadcast
+        """
+        if progress == self._last_sent:
+            return
+        self._pending = progress
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush())
+
+    async def _flush(self):
+        """
+        Send the latest pending progress after the throttle interval.
+        """
+        await asyncio.sleep(self._interval)
+        self._task = None
+        pending, self._pending = self._pending, None
+        if pending is not None and pending != self._last_sent:
+            self._last_sent = pending
+            await self._send(pending)
+
+    async def close(self):
+        """
+        Cancel any scheduled flush and send the final pending value.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        pending, self._pending = self._pending, None
+        if pending is not None and pending != self._last_sent:
+            self._last_sent = pending
+            await self._send(pending)
+
+
+@functools.lru_cache(maxsize=1024)
+def _ensure_output_dir(tenant_id: uuid.UUID) -> str:
+    """
+    Get the output directory for a tenant, creating it on first use.
+
+    Caching avoids repeating the makedirs syscall for every job of the
+    same tenant.
+
     Args:
-        job_data: Job data
         tenant_id: Tenant ID
+
+    Returns:
+        Output directory path
     """
-    job_id = uuid.UUID(job_data["job_id"])
-    user_id = uuid.UUID(job_data["user_id"])
-    file_path = job_data["file_path"]
-    workflow_config = job_data.get("workflow_config", {})
-    
-    logger.info(f"Processing transcription job {job_id} for tenant {tenant_id}")
-    
-    # Get tenant-specific storage path
-    tenant_storage_path = get_tenant_storage_path(tenant_id)
-    output_dir = os.path.join(tenant_storage_path, "outputs")
+    output_dir = os.path.join(get_tenant_storage_path(tenant_id), "outputs")
     os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+def _init_worker_pipeline():
+    """
+    Load the transcription pipeline once in a pool worker process.
+    """
+    global _worker_pipeline
+    from backend.routers.transcription.router import get_pipeline
+    _worker_pipeline = get_pipeline()
+
+
+def _run_transcribe(file_path: str, params: Dict[str, Any]):
+    """
+    Run transcription in a pool worker using its resident pipeline.
+
+    Args:
+        file_path: Path to the audio file
+        params: Transcription parameters
+
+    Returns:
+        Transcription result
+    """
+    return _worker_pipeline.transcribe(audio=file_path, **params)
+
+
+@functools.lru_cache
+def get_transcription_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Get the process pool used for transcription jobs.
+
+    Returns:
+        Process pool with the pipeline pre-loaded in each worker
+    """
+    max_workers = int(os.environ.get("TRANSCRIPTION_POOL_WORKERS", "1"))
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker_pipeline
+    )
+
+
+async def transcription_handler(payload: JobPayload, tenant_id: uuid.UUID):
+    """
+    Handler for transcription jobs.
+
+    Args:
+        payload: Job payload
+        tenant_id: Tenant ID
+    """
+    job_id = payload.job_id
+    user_id = payload.user_id
+    file_path = payload.file_path
+    workflow_config = payload.workflow_config or {}
+
+    logger.info("Processing transcription job %s for tenant %s", job_id, tenant_id)
     
-    # Prepare output path
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Get tenant-specific output directory (created once per tenant)
+    output_dir = _ensure_output_dir(tenant_id)
+
+    # Prepare output path (manual formatting skips datetime construction
+    # and the strftime format-string parse)
+    lt = time.localtime()
+    timestamp = (
+        f"{lt.tm_year}{lt.tm_mon:02d}{lt.tm_mday:02d}"
+        f"_{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}"
+    )
     output_filename = f"transcription_{timestamp}_{job_id}.json"
     output_path = os.path.join(output_dir, output_filename)
     
@@ -54,88 +186,84 @@ async def transcription_handler(job_data: Dict[str, Any], tenant_id: uuid.UUID):
             if "type" in node and "transcription" in node["type"].lower():
                 if "data" in node:
                     node_data = node["data"]
-                    
-                    # Extract parameters
-                    if "modelSize" in node_data:
-                        transcription_params["model_size"] = node_data["modelSize"]
-                    if "whisperType" in node_data:
-                        transcription_params["whisper_type"] = node_data["whisperType"]
-                    if "language" in node_data:
-                        transcription_params["language"] = node_data["language"]
-                    if "computeType" in node_data:
-                        transcription_params["compute_type"] = node_data["computeType"]
-                    if "vad" in node_data:
-                        transcription_params["vad"] = node_data["vad"]
-                    if "diarization" in node_data:
-                        transcription_params["diarization"] = node_data["diarization"]
-    
-    # Get transcription pipeline
-    pipeline = get_pipeline()
+                    transcription_params = {
+                        dst: node_data[src]
+                        for src, dst in _PARAM_MAP.items()
+                        if src in node_data
+                    }
+                # Only the first transcription node configures the pipeline
+                break
     
-    # Send progress update
-    await connection_manager.broadcast_job_update(
-        job_id=job_id,
-        tenant_id=tenant_id,
-        user_id=user_id,
-        status="processing",
-        result={"progress": 0}
-    )
-    
-    try:
-        # Record start time
-        start_time = time.time()
-        
-        # Process transcription
-        result = await asyncio.to_thread(
-            pipeline.transcribe,
-            audio=file_path,
-            **transcription_params
-        )
-        
-        # Calculate processing time
-        processing_time = int(time.time() - start_time)
-        
-        # Save result to file
-        with open(output_path, "w") as f:
-            json.dump(result, f, indent=2)
-            
-        # Update job in database
-        with get_db_session() as db:
-            job = db.query(Job).filter(Job.id == job_id).first()
-            
-            if job:
-                job.status = "completed"
-                job.result_path = output_path
-                job.processing_time = processing_time
-                job.completed_at = datetime.utcnow()
-                job.updated_at = datetime.utcnow()
-                db.commit()
-                
-        # Send completion update
+    async def send_progress(progress: float):
         await connection_manager.broadcast_job_update(
             job_id=job_id,
             tenant_id=tenant_id,
             user_id=user_id,
-            status="completed",
-            result={"path": output_path}
+            status="processing",
+            result={"progress": progress}
+        )
+
+    # Throttle any per-segment progress down to ~10 broadcasts per second
+    progress_throttle = ProgressThrottle(send_progress)
+
+    # Send initial progress update immediately
+    await send_progress(0)
+
+    try:
+        # Record start time (monotonic, immune to wall-clock jumps)
+        start_ns = time.monotonic_ns()
+
+        # Process transcription in the worker pool; the pool keeps the model
+        # loaded across jobs and keeps the GIL-bound parts off this process
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            get_transcription_pool(),
+            _run_transcribe,
+            file_path,
+            transcription_params
         )
         
-        logger.info(f"Completed transcription job {job_id} in {processing_time} seconds")
+        # Calculate processing time in whole seconds
+        processing_time = (time.monotonic_ns() - start_ns) // 1_000_000_000
         
+        # Save result to file (single C-level serialization, no pretty-print)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+
+        # Drop any coalesced intermediate progress, then fuse the final
+        # progress tick and the completion update into one bulk broadcast
+        await progress_throttle.close()
+        await connection_manager.broadcast_job_updates_bulk([
+            {
+                "job_id": job_id,
+                "tenant_id": tenant_id,
+                "user_id": user_id,
+                "status": "processing",
+                "result": {"progress": 100}
+            },
+            {
+                "job_id": job_id,
+                "tenant_id": tenant_id,
+                "user_id": user_id,
+                "status": "completed",
+                "result": {"path": output_path}
+            }
+        ])
+
+        logger.info("Completed transcription job %s in %d seconds", job_id, processing_time)
+
+        # The queue applies this in a single status write
+        return JobResult(
+            status="completed",
+            result_path=output_path,
+            processing_time=processing_time
+        )
+
     except Exception as e:
-        logger.error(f"Error processing transcription job {job_id}: {str(e)}")
-        
-        # Update job in database
-        with get_db_session() as db:
-            job = db.query(Job).filter(Job.id == job_id).first()
-            
-            if job:
-                job.status = "failed"
-                job.error = str(e)
-                job.updated_at = datetime.utcnow()
-                db.commit()
-                
-        # Send error update
+        logger.error("Error processing transcription job %s: %s", job_id, e)
+
+        # Drop any coalesced progress and send the error update
+        await progress_throttle.close()
         await connection_manager.broadcast_job_update(
             job_id=job_id,
             tenant_id=tenant_id,
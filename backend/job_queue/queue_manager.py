@@ -6,152 +6,289 @@ transcription jobs in a multi-tenant environment.
 """
 
 import asyncio
-import json
+import functools
+import itertools
 import logging
 import os
-import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Callable, Awaitable
-import threading
-import queue
 
+import orjson
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from backend.config import settings
 from backend.db.db_instance import get_db_session
 from backend.models.workflow import Job, UsageRecord
 from backend.models.tenant import Tenant
-from backend.utils.tenant_utils import get_tenant_storage_path
+from backend.utils.tenant_utils import (
+    get_tenant_storage_path,
+    invalidate_processing_usage,
+    invalidate_storage_usage,
+)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class QueueFullError(Exception):
+    """
+    Raised when a tenant's job queue has reached its maximum depth.
+    """
+    pass
+
+
+@functools.lru_cache(maxsize=512)
+def parse_workflow_config(workflow_id: uuid.UUID, config_str: str) -> Dict[str, Any]:
+    """
+    Parse a workflow configuration, caching the result per workflow.
+
+    The cache key includes the raw config string, so an updated workflow
+    simply misses and gets re-parsed; call `parse_workflow_config.cache_clear()`
+    after workflow updates to drop the stale entry eagerly.
+
+    Args:
+        workflow_id: Workflow ID
+        config_str: Raw JSON configuration
+
+    Returns:
+        Parsed configuration dict
+    """
+    return orjson.loads(config_str)
+
+
+@dataclass(slots=True)
+class JobPayload:
+    """
+    Typed payload handed to job handlers.
+
+    Keeps job/tenant/user IDs as uuid.UUID throughout instead of
+    stringifying them for a dict and re-parsing in the handler, and
+    pickles faster than a dict when crossing process boundaries.
+    """
+    job_id: uuid.UUID
+    tenant_id: uuid.UUID
+    user_id: uuid.UUID
+    file_path: str
+    workflow_config: Dict[str, Any]
+    job_type: Optional[str] = None
+
+
+@dataclass
+class JobResult:
+    """
+    Outcome of a job handler.
+
+    Handlers return this instead of writing job status themselves, so each
+    job finishes with a single status write from the queue.
+    """
+    status: str = "completed"
+    result_path: Optional[str] = None
+    processing_time: Optional[int] = None
+    error: Optional[str] = None
+
+
 class JobQueue:
     """
     Job queue for processing transcription jobs with tenant isolation.
+
+    All queue bookkeeping lives on a single asyncio event loop. Each tenant
+    gets an `asyncio.PriorityQueue` drained by long-lived worker coroutines,
+    with an `asyncio.Semaphore` bounding per-tenant concurrency. This avoids
+    the cost of one OS thread per tenant and of creating a fresh event loop
+    for every job.
     """
-    
+
     def __init__(self):
         """
         Initialize the job queue.
         """
-        self._queues: Dict[uuid.UUID, queue.PriorityQueue] = {}
-        self._workers: Dict[uuid.UUID, threading.Thread] = {}
+        self._queues: Dict[uuid.UUID, asyncio.PriorityQueue] = {}
+        self._semaphores: Dict[uuid.UUID, asyncio.Semaphore] = {}
+        self._workers: Dict[uuid.UUID, List[asyncio.Task]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._running = False
-        self._lock = threading.Lock()
-        self._job_handlers: Dict[str, Callable[[Dict[str, Any], uuid.UUID], Awaitable[None]]] = {}
-        self._max_workers_per_tenant = 2  # Default max workers per tenant
-        
+        self._job_handlers: Dict[str, Callable[["JobPayload", uuid.UUID], Awaitable[Optional[JobResult]]]] = {}
+        self._max_workers_per_tenant: Dict[uuid.UUID, int] = {}
+        self._default_max_workers = 2  # Default max workers per tenant
+        self._counter = itertools.count()  # FIFO tiebreaker for equal priorities
+        self._pending_updates: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_interval = 0.05  # Coalescing window for status writes, in seconds
+
     def start(self):
         """
         Start the job queue.
+
+        Must be called from a thread with a running (or current) event loop;
+        worker coroutines are spawned lazily on that loop as tenants enqueue
+        their first job.
         """
         if self._running:
             return
-            
+
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = asyncio.get_event_loop()
         self._running = True
         logger.info("Job queue started")
-        
+
     def stop(self):
         """
         Stop the job queue.
         """
         if not self._running:
             return
-            
+
         self._running = False
-        
-        # Stop all workers
-        for tenant_id, worker in self._workers.items():
-            logger.info(f"Stopping worker for tenant {tenant_id}")
-            # Workers will check self._running and exit
-            
-        # Wait for all workers to stop
-        for tenant_id, worker in self._workers.items():
-            if worker.is_alive():
-                worker.join(timeout=5.0)
-                
+
+        # Cancel all worker coroutines
+        for tenant_id, workers in self._workers.items():
+            logger.info("Stopping workers for tenant %s", tenant_id)
+            for worker in workers:
+                worker.cancel()
+
+        self._workers.clear()
+        self._queues.clear()
+        self._semaphores.clear()
+
+        # Flush any status updates still waiting in the coalescing buffer
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._drain_pending_updates()
+
         logger.info("Job queue stopped")
-        
-    def register_handler(self, job_type: str, handler: Callable[[Dict[str, Any], uuid.UUID], Awaitable[None]]):
+
+    def register_handler(self, job_type: str, handler: Callable[["JobPayload", uuid.UUID], Awaitable[Optional[JobResult]]]):
         """
         Register a handler for a specific job type.
-        
+
         Args:
             job_type: Type of job to handle
             handler: Async function to handle the job
         """
         self._job_handlers[job_type] = handler
-        logger.info(f"Registered handler for job type: {job_type}")
-        
+        logger.info("Registered handler for job type: %s", job_type)
+
     def enqueue_job(self, job_id: uuid.UUID, tenant_id: uuid.UUID, priority: int = 1):
         """
         Enqueue a job for processing.
-        
+
+        Safe to call from any thread; the enqueue itself is marshalled onto
+        the queue's event loop.
+
         Args:
             job_id: Job ID
             tenant_id: Tenant ID
             priority: Job priority (lower number = higher priority)
         """
-        with self._lock:
-            # Create queue for tenant if it doesn't exist
-            if tenant_id not in self._queues:
-                self._queues[tenant_id] = queue.PriorityQueue()
-                
-            # Create worker for tenant if it doesn't exist
-            if tenant_id not in self._workers or not self._workers[tenant_id].is_alive():
-                worker = threading.Thread(
-                    target=self._worker_thread,
-                    args=(tenant_id,),
-                    daemon=True
-                )
-                self._workers[tenant_id] = worker
-                worker.start()
-                
-            # Enqueue job
-            self._queues[tenant_id].put((priority, job_id))
-            logger.info(f"Enqueued job {job_id} for tenant {tenant_id} with priority {priority}")
-            
-    def _worker_thread(self, tenant_id: uuid.UUID):
-        """
-        Worker thread for processing jobs for a specific tenant.
-        
+        if not self._running or self._loop is None:
+            raise RuntimeError("Job queue is not running")
+
+        # Reject before crossing to the loop thread so callers can surface
+        # backpressure (HTTP 429) instead of growing the queue unboundedly
+        tenant_queue = self._queues.get(tenant_id)
+        if tenant_queue is not None and tenant_queue.full():
+            raise QueueFullError(f"Job queue for tenant {tenant_id} is full")
+
+        self._loop.call_soon_threadsafe(self._enqueue, job_id, tenant_id, priority)
+        logger.info("Enqueued job %s for tenant %s with priority %d", job_id, tenant_id, priority)
+
+    def _enqueue(self, job_id: uuid.UUID, tenant_id: uuid.UUID, priority: int):
+        """
+        Enqueue a job on the event loop thread.
+
+        Args:
+            job_id: Job ID
+            tenant_id: Tenant ID
+            priority: Job priority (lower number = higher priority)
+        """
+        # The monotonic counter breaks priority ties in FIFO order and keeps
+        # the heap from ever comparing uuid.UUID objects.
+        try:
+            self._get_queue(tenant_id).put_nowait((priority, next(self._counter), job_id))
+        except asyncio.QueueFull:
+            # Lost the race against concurrent enqueues; fail the job rather
+            # than block the loop
+            logger.error("Queue full for tenant %s, dropping job %s", tenant_id, job_id)
+            self._update_job_status(job_id, "failed", error="Tenant job queue is full")
+
+    def _get_queue(self, tenant_id: uuid.UUID) -> asyncio.PriorityQueue:
+        """
+        Get the queue for a tenant, creating it and its workers on first use.
+
+        Must be called on the event loop thread.
+
+        Args:
+            tenant_id: Tenant ID
+
+        Returns:
+            Priority queue for the tenant
+        """
+        tenant_queue = self._queues.get(tenant_id)
+        if tenant_queue is None:
+            max_workers = self._max_workers_per_tenant.get(tenant_id, self._default_max_workers)
+            tenant_queue = asyncio.PriorityQueue(maxsize=settings.MAX_TENANT_QUEUE_DEPTH)
+            self._queues[tenant_id] = tenant_queue
+            self._semaphores[tenant_id] = asyncio.Semaphore(max_workers)
+            self._workers[tenant_id] = [
+                asyncio.create_task(self._worker(tenant_id))
+                for _ in range(max_workers)
+            ]
+        return tenant_queue
+
+    async def _worker(self, tenant_id: uuid.UUID):
+        """
+        Worker coroutine for processing jobs for a specific tenant.
+
         Args:
             tenant_id: Tenant ID
         """
-        logger.info(f"Started worker thread for tenant {tenant_id}")
-        
+        logger.info("Started worker for tenant %s", tenant_id)
+
+        tenant_queue = self._queues[tenant_id]
+
         while self._running:
+            # Surplus workers from a pool shrink exit here, between jobs,
+            # so in-flight work is never cancelled mid-handler. The check
+            # runs before the queue get so an exiting worker cannot
+            # consume (and lose) a queued job.
+            workers = self._workers.get(tenant_id)
+            if workers is not None and asyncio.current_task() not in workers:
+                break
+
             try:
-                # Get job from queue with timeout
-                try:
-                    priority, job_id = self._queues[tenant_id].get(timeout=1.0)
-                except queue.Empty:
-                    continue
-                    
-                # Process job
+                # Get job from queue
+                priority, _, job_id = await tenant_queue.get()
+
+                # Process job; the semaphore is re-read each iteration so
+                # pool resizes take effect for subsequent jobs
                 try:
-                    logger.info(f"Processing job {job_id} for tenant {tenant_id}")
-                    self._process_job(job_id, tenant_id)
+                    logger.info("Processing job %s for tenant %s", job_id, tenant_id)
+                    async with self._semaphores[tenant_id]:
+                        await self._process_job(job_id, tenant_id)
                 except Exception as e:
-                    logger.error(f"Error processing job {job_id}: {str(e)}")
+                    logger.error("Error processing job %s: %s", job_id, e)
                     # Update job status to failed
                     self._update_job_status(job_id, "failed", error=str(e))
                 finally:
                     # Mark job as done in queue
-                    self._queues[tenant_id].task_done()
+                    tenant_queue.task_done()
+            except asyncio.CancelledError:
+                break
             except Exception as e:
-                logger.error(f"Error in worker thread for tenant {tenant_id}: {str(e)}")
-                time.sleep(1.0)  # Avoid tight loop on error
-                
-        logger.info(f"Stopped worker thread for tenant {tenant_id}")
-        
-    def _process_job(self, job_id: uuid.UUID, tenant_id: uuid.UUID):
+                logger.error("Error in worker for tenant %s: %s", tenant_id, e)
+                await asyncio.sleep(1.0)  # Avoid tight loop on error
+
+        logger.info("Stopped worker for tenant %s", tenant_id)
+
+    async def _process_job(self, job_id: uuid.UUID, tenant_id: uuid.UUID):
         """
         Process a job.
-        
+
         Args:
             job_id: Job ID
             tenant_id: Tenant ID
@@ -162,93 +299,105 @@ class JobQueue:
                 Job.id == job_id,
                 Job.tenant_id == tenant_id
             ).first()
-            
+
             if not job:
-                logger.error(f"Job {job_id} not found for tenant {tenant_id}")
+                logger.error("Job %s not found for tenant %s", job_id, tenant_id)
                 return
-                
+
             # Check if job is already being processed or completed
             if job.status in ["processing", "completed", "failed"]:
-                logger.info(f"Job {job_id} is already {job.status}")
+                logger.info("Job %s is already %s", job_id, job.status)
                 return
-                
+
             # Update job status to processing
             job.status = "processing"
             job.updated_at = datetime.utcnow()
             db.commit()
-            
+
             # Get workflow configuration
             workflow_config = {}
             if job.workflow_id:
                 workflow = job.workflow
                 if workflow:
                     try:
-                        workflow_config = json.loads(workflow.config)
-                    except json.JSONDecodeError:
-                        logger.error(f"Invalid workflow configuration for workflow {workflow.id}")
+                        workflow_config = parse_workflow_config(workflow.id, workflow.config)
+                    except orjson.JSONDecodeError:
+                        logger.error("Invalid workflow configuration for workflow %s", workflow.id)
                         workflow_config = {}
-            
-            # Prepare job data
-            job_data = {
-                "job_id": str(job_id),
-                "tenant_id": str(tenant_id),
-                "user_id": str(job.user_id),
-                "file_path": job.file_path,
-                "workflow_config": workflow_config
-            }
-            
-        # Process job asynchronously
-        asyncio.run(self._process_job_async(job_data, tenant_id))
-        
-    async def _process_job_async(self, job_data: Dict[str, Any], tenant_id: uuid.UUID):
+
+            # Prepare job payload
+            payload = JobPayload(
+                job_id=job_id,
+                tenant_id=tenant_id,
+                user_id=job.user_id,
+                file_path=job.file_path,
+                workflow_config=workflow_config
+            )
+
+        # Process job on the shared event loop
+        await self._process_job_async(payload, tenant_id)
+
+    async def _process_job_async(self, payload: JobPayload, tenant_id: uuid.UUID):
         """
         Process a job asynchronously.
-        
+
         Args:
-            job_data: Job data
+            payload: Job payload
             tenant_id: Tenant ID
         """
-        job_id = uuid.UUID(job_data["job_id"])
-        
+        job_id = payload.job_id
+
         try:
             # Determine job type from workflow config or file extension
             job_type = "transcription"  # Default job type
-            
-            if "job_type" in job_data:
-                job_type = job_data["job_type"]
-            elif "workflow_config" in job_data and job_data["workflow_config"]:
+
+            if payload.job_type:
+                job_type = payload.job_type
+            elif payload.workflow_config:
                 # Extract job type from workflow config
-                if "nodes" in job_data["workflow_config"]:
-                    for node in job_data["workflow_config"]["nodes"]:
-                        if "type" in node:
-                            if "transcription" in node["type"].lower():
-                                job_type = "transcription"
-                            elif "translation" in node["type"].lower():
-                                job_type = "translation"
-                            elif "diarization" in node["type"].lower():
-                                job_type = "diarization"
-                            # Add more job types as needed
-            
+                for node in payload.workflow_config.get("nodes", ()):
+                    if "type" in node:
+                        if "transcription" in node["type"].lower():
+                            job_type = "transcription"
+                        elif "translation" in node["type"].lower():
+                            job_type = "translation"
+                        elif "diarization" in node["type"].lower():
+                            job_type = "diarization"
+                        # Add more job types as needed
+
             # Check if handler exists for job type
             if job_type not in self._job_handlers:
                 raise ValueError(f"No handler registered for job type: {job_type}")
-                
+
             # Call handler
-            await self._job_handlers[job_type](job_data, tenant_id)
-            
-            # Update job status to completed
-            self._update_job_status(job_id, "completed")
-            
+            result = await self._job_handlers[job_type](payload, tenant_id)
+
+            # Apply the handler's outcome in a single status write
+            if isinstance(result, JobResult):
+                self._update_job_status(
+                    job_id,
+                    result.status,
+                    result_path=result.result_path,
+                    error=result.error,
+                    processing_time=result.processing_time
+                )
+            else:
+                self._update_job_status(job_id, "completed")
+
         except Exception as e:
-            logger.error(f"Error processing job {job_id}: {str(e)}")
+            logger.error("Error processing job %s: %s", job_id, e)
             # Update job status to failed
             self._update_job_status(job_id, "failed", error=str(e))
-            
-    def _update_job_status(self, job_id: uuid.UUID, status: str, result_path: Optional[str] = None, 
+
+    def _update_job_status(self, job_id: uuid.UUID, status: str, result_path: Optional[str] = None,
                           error: Optional[str] = None, processing_time: Optional[int] = None):
         """
-        Update job status in the database.
-        
+        Queue a job status update for the database.
+
+        Updates are buffered and flushed in a single bulk UPDATE + commit so
+        that status transitions cost one DB round-trip per batch instead of
+        one per job.
+
         Args:
             job_id: Job ID
             status: New status
@@ -256,38 +405,127 @@ class JobQueue:
             error: Error message
             processing_time: Processing time in seconds
         """
+        now = datetime.utcnow()
+        mapping: Dict[str, Any] = {
+            "id": job_id,
+            "status": status,
+            "updated_at": now
+        }
+
+        if status == "completed":
+            mapping["completed_at"] = now
+
+        if result_path:
+            mapping["result_path"] = result_path
+
+        if error:
+            mapping["error"] = error
+
+        if processing_time:
+            mapping["processing_time"] = processing_time
+
+        self._pending_updates.append(mapping)
+
+        # Schedule a flush after the coalescing window
+        if self._flush_task is None and self._loop is not None:
+            self._flush_task = self._loop.create_task(self._flush_job_updates())
+
+    async def _flush_job_updates(self):
+        """
+        Flush buffered job status updates after the coalescing window.
+        """
+        try:
+            await asyncio.sleep(self._flush_interval)
+        finally:
+            self._flush_task = None
+
+        # Swap the buffer on the loop thread, then run the blocking
+        # session work in a worker thread so the flush never stalls the
+        # loop that serves websockets and job scheduling
+        updates, self._pending_updates = self._pending_updates, []
+        if not updates:
+            return
+        try:
+            await asyncio.to_thread(self._write_updates, updates)
+        except Exception as e:
+            # Never let a drain failure escape as an unhandled task error
+            logger.error("Error flushing job status updates: %s", e)
+
+    def _drain_pending_updates(self):
+        """
+        Synchronously flush buffered job status updates (shutdown path).
+        """
+        updates, self._pending_updates = self._pending_updates, []
+        if updates:
+            self._write_updates(updates)
+
+    def _write_updates(self, updates: List[Dict[str, Any]]):
+        """
+        Write a batch of job status updates to the database.
+
+        Blocking; called from a worker thread (or directly at shutdown).
+        Status updates and usage inserts commit separately, and each
+        falls back to per-row writes when the batch fails, so one bad
+        row - e.g. the quota trigger rejecting a single tenant's usage
+        insert - cannot discard unrelated jobs' status transitions.
+        """
         with get_db_session() as db:
-            job = db.query(Job).filter(Job.id == job_id).first()
-            
-            if not job:
-                logger.error(f"Job {job_id} not found")
-                return
-                
-            job.status = status
-            job.updated_at = datetime.utcnow()
-            
-            if status == "completed":
-                job.completed_at = datetime.utcnow()
-                
-            if result_path:
-                job.result_path = result_path
-                
-            if error:
-                job.error = error
-                
-            if processing_time:
-                job.processing_time = processing_time
-                
-            db.commit()
-            
-            # Record usage for completed jobs
-            if status == "completed" and processing_time:
-                self._record_usage(db, job, processing_time)
-                
+            try:
+                db.bulk_update_mappings(Job, updates)
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.error("Bulk status update failed, retrying per job: %s", e)
+                for update in updates:
+                    try:
+                        db.bulk_update_mappings(Job, [update])
+                        db.commit()
+                    except SQLAlchemyError as row_error:
+                        db.rollback()
+                        logger.error(
+                            "Dropping status update for job %s: %s",
+                            update["id"], row_error
+                        )
+
+            # Record usage for completed jobs in their own transaction
+            completed = [
+                update for update in updates
+                if update["status"] == "completed" and update.get("processing_time")
+            ]
+            if completed:
+                jobs = db.query(Job).filter(
+                    Job.id.in_([update["id"] for update in completed])
+                ).all()
+                jobs_by_id = {job.id: job for job in jobs}
+                try:
+                    for update in completed:
+                        job = jobs_by_id.get(update["id"])
+                        if job:
+                            self._record_usage(db, job, update["processing_time"])
+                    db.commit()
+                except SQLAlchemyError as e:
+                    db.rollback()
+                    logger.error("Bulk usage insert failed, retrying per job: %s", e)
+                    for update in completed:
+                        job = jobs_by_id.get(update["id"])
+                        if not job:
+                            continue
+                        try:
+                            self._record_usage(db, job, update["processing_time"])
+                            db.commit()
+                        except SQLAlchemyError as row_error:
+                            db.rollback()
+                            logger.error(
+                                "Dropping usage record for job %s: %s",
+                                update["id"], row_error
+                            )
+
     def _record_usage(self, db: Session, job: Job, processing_time: int):
         """
         Record resource usage for a job.
-        
+
+        The caller is responsible for committing the session.
+
         Args:
             db: Database session
             job: Job object
@@ -303,13 +541,16 @@ class JobQueue:
             unit="seconds"
         )
         db.add(processing_usage)
-        
-        # Record storage usage if result path exists
-        if job.result_path and os.path.exists(job.result_path):
+
+        # New usage row changes this month's total; drop the cached sum
+        invalidate_processing_usage(job.tenant_id)
+
+        # Record storage usage if result path exists (single stat call; a
+        # missing file surfaces as OSError instead of a separate exists check)
+        if job.result_path:
             try:
-                # Calculate file size in MB
-                file_size_mb = os.path.getsize(job.result_path) / (1024 * 1024)
-                
+                file_size_mb = os.stat(job.result_path).st_size / (1024 * 1024)
+
                 storage_usage = UsageRecord(
                     tenant_id=job.tenant_id,
                     user_id=job.user_id,
@@ -319,47 +560,85 @@ class JobQueue:
                     unit="MB"
                 )
                 db.add(storage_usage)
+
+                # The result file just changed this tenant's disk usage;
+                # drop the cached total so the next quota check re-walks
+                invalidate_storage_usage(job.tenant_id)
             except OSError as e:
-                logger.error(f"Error calculating file size for {job.result_path}: {str(e)}")
-                
-        db.commit()
-        
+                logger.error("Error calculating file size for %s: %s", job.result_path, e)
+
     def set_max_workers_per_tenant(self, tenant_id: uuid.UUID, max_workers: int):
         """
-        Set the maximum number of worker threads for a tenant.
-        
+        Set the maximum number of concurrent workers for a tenant.
+
+        Takes effect immediately for a running pool; jobs already in flight
+        finish under the previous limit.
+
+        Args:
+            tenant_id: Tenant ID
+            max_workers: Maximum number of concurrent workers
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self._max_workers_per_tenant[tenant_id] = max_workers
+
+        # Resize a running pool on the loop thread
+        if self._running and self._loop is not None and tenant_id in self._queues:
+            self._loop.call_soon_threadsafe(self._resize_workers, tenant_id, max_workers)
+
+    def _resize_workers(self, tenant_id: uuid.UUID, max_workers: int):
+        """
+        Resize a tenant's worker pool on the event loop thread.
+
         Args:
             tenant_id: Tenant ID
-            max_workers: Maximum number of worker threads
+            max_workers: Target number of workers
         """
-        # Not implemented yet - would require multiple workers per tenant
-        self._max_workers_per_tenant = max_workers
-        
+        workers = self._workers.get(tenant_id)
+        if workers is None:
+            return
+
+        self._semaphores[tenant_id] = asyncio.Semaphore(max_workers)
+
+        if max_workers > len(workers):
+            workers.extend(
+                asyncio.create_task(self._worker(tenant_id))
+                for _ in range(max_workers - len(workers))
+            )
+        elif max_workers < len(workers):
+            # Dropping the surplus tasks from the pool list makes them
+            # exit at the top of their loop instead of being cancelled:
+            # a worker mid-_process_job finishes its job first, and the
+            # replaced semaphore already enforces the new concurrency
+            # bound for everything that starts afterwards
+            del workers[max_workers:]
+
+        logger.info("Resized worker pool for tenant %s to %d", tenant_id, max_workers)
+
     def get_queue_length(self, tenant_id: uuid.UUID) -> int:
         """
         Get the number of jobs in the queue for a tenant.
-        
+
         Args:
             tenant_id: Tenant ID
-            
+
         Returns:
             Number of jobs in the queue
         """
-        with self._lock:
-            if tenant_id not in self._queues:
-                return 0
-                
-            return self._queues[tenant_id].qsize()
-            
+        if tenant_id not in self._queues:
+            return 0
+
+        return self._queues[tenant_id].qsize()
+
     def get_active_tenants(self) -> List[uuid.UUID]:
         """
         Get a list of tenant IDs with active queues.
-        
+
         Returns:
             List of tenant IDs
         """
-        with self._lock:
-            return list(self._queues.keys())
+        return list(self._queues.keys())
 
 
 # Create global job queue instance
@@ -371,31 +650,31 @@ def start_job_queue():
     Start the job queue.
     """
     job_queue.start()
-    
-    
+
+
 def stop_job_queue():
     """
     Stop the job queue.
     """
     job_queue.stop()
-    
-    
+
+
 def enqueue_job(job_id: uuid.UUID, tenant_id: uuid.UUID, priority: int = 1):
     """
     Enqueue a job for processing.
-    
+
     Args:
         job_id: Job ID
         tenant_id: Tenant ID
         priority: Job priority (lower number = higher priority)
     """
     job_queue.enqueue_job(job_id, tenant_id, priority)
-    
-    
-def register_handler(job_type: str, handler: Callable[[Dict[str, Any], uuid.UUID], Awaitable[None]]):
+
+
+def register_handler(job_type: str, handler: Callable[["JobPayload", uuid.UUID], Awaitable[Optional[JobResult]]]):
     """
     Register a handler for a specific job type.
-    
+
     Args:
         job_type: Type of job to handle
         handler: Async function to handle the job
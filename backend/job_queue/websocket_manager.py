@@ -6,173 +6,367 @@ with tenant isolation.
 """
 
 import asyncio
-import json
+import concurrent.futures
 import logging
 import uuid
-from typing import Dict, List, Set, Any, Optional
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Any, Optional, Tuple
 from fastapi import WebSocket, WebSocketDisconnect, Depends, HTTPException
 import jwt
+import orjson
 
 from backend.config import settings
-from backend.middleware.tenant_context import get_tenant_id
+from backend.middleware.tenant_context import get_tenant_id, decode_token, get_cached_token
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-connection outgoing queue depth; a client that falls this many
+# messages behind is considered too slow and gets dropped
+OUTGOING_QUEUE_SIZE = 256
+
+# Payloads at least this large going to at least this many recipients are
+# zlib-compressed once (level 1) and delivered as binary frames; clients
+# decompress binary frames before parsing
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_MIN_TARGETS = 8
+
+
+def _encode_payload(message: Dict[str, Any], n_targets: int):
+    """
+    Serialize a broadcast message, compressing large wide fan-outs.
+
+    Args:
+        message: Message to serialize
+        n_targets: Number of recipients the payload will reach
+
+    Returns:
+        A str for ordinary messages, or compressed bytes when the payload
+        is big enough and shared widely enough to pay for the deflate
+    """
+    raw = orjson.dumps(message)
+    if len(raw) >= COMPRESS_MIN_SIZE and n_targets >= COMPRESS_MIN_TARGETS:
+        return zlib.compress(raw, 1)
+    return raw.decode()
+
+
+@dataclass(slots=True)
+class ConnectionInfo:
+    """
+    Per-connection state tracked by the ConnectionManager.
+    """
+    tenant_id: uuid.UUID
+    user_id: uuid.UUID
+    queue: asyncio.Queue
+    writer_task: asyncio.Task
+    subscriptions: Set[int] = field(default_factory=set)
+
 
 class ConnectionManager:
     """
     WebSocket connection manager for real-time job updates.
     """
-    
+
     def __init__(self):
         """
         Initialize the connection manager.
         """
-        # Store active connections by tenant_id and user_id
-        self.active_connections: Dict[uuid.UUID, Dict[uuid.UUID, List[WebSocket]]] = {}
-        # Store job subscriptions by connection
-        self.job_subscriptions: Dict[WebSocket, Set[uuid.UUID]] = {}
+        # Flat connection table: every operation is one dict/set lookup
+        # instead of walking nested per-tenant/per-user containers
+        self.connections: Dict[WebSocket, ConnectionInfo] = {}
+        # Index sets for tenant- and user-scoped broadcasts. Keys are
+        # uuid.int values: hashing a plain int is one machine word versus
+        # re-hashing the 16-byte UUID payload on every lookup
+        self.by_tenant: Dict[int, Set[WebSocket]] = {}
+        self.by_user: Dict[Tuple[int, int], Set[WebSocket]] = {}
+        # Inverse index: subscribers by job, so a broadcast only touches
+        # connections that care about that job
+        self.job_subscribers: Dict[int, Set[WebSocket]] = {}
+        # Non-terminal job updates coalesced per job between flushes
+        # (last writer wins), plus the shared flush task
+        self._pending_updates: Dict[uuid.UUID, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._coalesce_interval = 0.025
         # Lock for thread safety
         self._lock = asyncio.Lock()
-        
+
     async def connect(self, websocket: WebSocket, tenant_id: uuid.UUID, user_id: uuid.UUID):
         """
         Connect a WebSocket client.
-        
+
         Args:
             websocket: WebSocket connection
             tenant_id: Tenant ID
             user_id: User ID
         """
         await websocket.accept()
-        
+
         async with self._lock:
-            # Initialize tenant dict if not exists
-            if tenant_id not in self.active_connections:
-                self.active_connections[tenant_id] = {}
-                
-            # Initialize user list if not exists
-            if user_id not in self.active_connections[tenant_id]:
-                self.active_connections[tenant_id][user_id] = []
-                
-            # Add connection to user list
-            self.active_connections[tenant_id][user_id].append(websocket)
-            
-            # Initialize job subscriptions
-            self.job_subscriptions[websocket] = set()
-            
+            # Dedicated writer task draining this connection's queue
+            queue = asyncio.Queue(maxsize=OUTGOING_QUEUE_SIZE)
+            self.connections[websocket] = ConnectionInfo(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                queue=queue,
+                writer_task=asyncio.create_task(self._writer(websocket, queue))
+            )
+            self.by_tenant.setdefault(tenant_id.int, set()).add(websocket)
+            self.by_user.setdefault((tenant_id.int, user_id.int), set()).add(websocket)
+
         logger.info(f"Client connected: tenant_id={tenant_id}, user_id={user_id}")
-        
+
     async def disconnect(self, websocket: WebSocket, tenant_id: uuid.UUID, user_id: uuid.UUID):
         """
         Disconnect a WebSocket client.
-        
+
         Args:
             websocket: WebSocket connection
             tenant_id: Tenant ID
             user_id: User ID
         """
         async with self._lock:
-            # Remove connection from user list
-            if (tenant_id in self.active_connections and 
-                user_id in self.active_connections[tenant_id]):
-                if websocket in self.active_connections[tenant_id][user_id]:
-                    self.active_connections[tenant_id][user_id].remove(websocket)
-                    
-                # Remove user if no connections
-                if not self.active_connections[tenant_id][user_id]:
-                    del self.active_connections[tenant_id][user_id]
-                    
-                # Remove tenant if no users
-                if not self.active_connections[tenant_id]:
-                    del self.active_connections[tenant_id]
-                    
-            # Remove job subscriptions
-            if websocket in self.job_subscriptions:
-                del self.job_subscriptions[websocket]
-                
+            self._remove_connection_locked(websocket)
+
         logger.info(f"Client disconnected: tenant_id={tenant_id}, user_id={user_id}")
-        
+
     async def subscribe_to_job(self, websocket: WebSocket, job_id: uuid.UUID):
         """
         Subscribe to job updates.
-        
+
         Args:
             websocket: WebSocket connection
             job_id: Job ID
         """
         async with self._lock:
-            if websocket in self.job_subscriptions:
-                self.job_subscriptions[websocket].add(job_id)
-                
+            info = self.connections.get(websocket)
+            if info is not None:
+                info.subscriptions.add(job_id.int)
+                self.job_subscribers.setdefault(job_id.int, set()).add(websocket)
+
         logger.info(f"Client subscribed to job {job_id}")
-        
+
     async def unsubscribe_from_job(self, websocket: WebSocket, job_id: uuid.UUID):
         """
         Unsubscribe from job updates.
-        
+
         Args:
             websocket: WebSocket connection
             job_id: Job ID
         """
         async with self._lock:
-            if websocket in self.job_subscriptions:
-                if job_id in self.job_subscriptions[websocket]:
-                    self.job_subscriptions[websocket].remove(job_id)
-                    
+            info = self.connections.get(websocket)
+            if info is not None:
+                info.subscriptions.discard(job_id.int)
+            subscribers = self.job_subscribers.get(job_id.int)
+            if subscribers:
+                subscribers.discard(websocket)
+                if not subscribers:
+                    del self.job_subscribers[job_id.int]
+
         logger.info(f"Client unsubscribed from job {job_id}")
-        
+
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """
         Send a message to a specific client.
-        
+
         Args:
             message: Message to send
             websocket: WebSocket connection
         """
-        try:
-            await websocket.send_json(message)
-        except Exception as e:
-            logger.error(f"Error sending message to client: {str(e)}")
-            
+        self._enqueue(websocket, orjson.dumps(message).decode())
+
     async def broadcast_to_tenant(self, message: Dict[str, Any], tenant_id: uuid.UUID):
         """
         Broadcast a message to all clients in a tenant.
-        
+
         Args:
             message: Message to send
             tenant_id: Tenant ID
         """
-        if tenant_id not in self.active_connections:
-            return
-            
-        for user_id, connections in self.active_connections[tenant_id].items():
-            for connection in connections:
-                await self.send_personal_message(message, connection)
-                
+        async with self._lock:
+            targets = list(self.by_tenant.get(tenant_id.int, ()))
+
+        if targets:
+            await self._fan_out(message, targets)
+
     async def broadcast_to_user(self, message: Dict[str, Any], tenant_id: uuid.UUID, user_id: uuid.UUID):
         """
         Broadcast a message to all clients of a user.
-        
+
         Args:
             message: Message to send
             tenant_id: Tenant ID
             user_id: User ID
         """
-        if (tenant_id not in self.active_connections or 
-            user_id not in self.active_connections[tenant_id]):
+        async with self._lock:
+            targets = list(self.by_user.get((tenant_id.int, user_id.int), ()))
+
+        if targets:
+            await self._fan_out(message, targets)
+
+    async def _fan_out(self, message: Dict[str, Any], targets: List[WebSocket]):
+        """
+        Enqueue a message for several clients.
+
+        The payload is serialized once and handed to each connection's
+        writer task, so the broadcaster returns immediately and a slow
+        client only backs up its own queue.
+
+        Args:
+            message: Message to send
+            targets: WebSocket connections to send to
+        """
+        payload = _encode_payload(message, len(targets))
+        for ws in targets:
+            self._enqueue(ws, payload)
+
+    def _enqueue(self, websocket: WebSocket, payload):
+        """
+        Put a serialized payload on a connection's outgoing queue.
+
+        A full queue means the client cannot keep up; it is dropped rather
+        than allowed to stall broadcasts.
+
+        Args:
+            websocket: WebSocket connection
+            payload: Already-serialized message (str, or bytes when
+                compressed)
+        """
+        info = self.connections.get(websocket)
+        if info is None:
+            return
+        try:
+            info.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.warning("Dropping slow websocket client: outgoing queue full")
+            asyncio.create_task(self._drop_connection(websocket))
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        Drain a connection's outgoing queue onto the socket.
+
+        One writer task per connection; broadcasters never touch the
+        socket directly.
+
+        Args:
+            websocket: WebSocket connection
+            queue: The connection's outgoing queue
+        """
+        try:
+            while True:
+                payload = await queue.get()
+                if isinstance(payload, bytes):
+                    await websocket.send_bytes(payload)
+                else:
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending message to client: {str(e)}")
+            await self._drop_connection(websocket)
+
+    async def _drop_connection(self, websocket: WebSocket):
+        """
+        Remove a failed or too-slow connection and close its socket.
+
+        Args:
+            websocket: WebSocket connection to drop
+        """
+        async with self._lock:
+            self._remove_connection_locked(websocket)
+        try:
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+
+    def _remove_connection_locked(self, websocket: WebSocket):
+        """
+        Remove a websocket from every index. Caller must hold the lock.
+
+        All removals are O(1) dict/set operations against the flat
+        connection table.
+
+        Args:
+            websocket: WebSocket connection to remove
+        """
+        info = self.connections.pop(websocket, None)
+        if info is None:
             return
-            
-        for connection in self.active_connections[tenant_id][user_id]:
-            await self.send_personal_message(message, connection)
-            
-    async def broadcast_job_update(self, job_id: uuid.UUID, tenant_id: uuid.UUID, user_id: uuid.UUID, 
+
+        tenant_set = self.by_tenant.get(info.tenant_id.int)
+        if tenant_set:
+            tenant_set.discard(websocket)
+            if not tenant_set:
+                del self.by_tenant[info.tenant_id.int]
+
+        user_key = (info.tenant_id.int, info.user_id.int)
+        user_set = self.by_user.get(user_key)
+        if user_set:
+            user_set.discard(websocket)
+            if not user_set:
+                del self.by_user[user_key]
+
+        for job_id in info.subscriptions:
+            subscribers = self.job_subscribers.get(job_id)
+            if subscribers:
+                subscribers.discard(websocket)
+                if not subscribers:
+                    del self.job_subscribers[job_id]
+
+        if info.writer_task is not asyncio.current_task():
+            info.writer_task.cancel()
+
+    async def broadcast_job_update(self, job_id: uuid.UUID, tenant_id: uuid.UUID, user_id: uuid.UUID,
                                   status: str, result: Optional[Dict[str, Any]] = None):
         """
         Broadcast a job update to all subscribed clients.
-        
+
+        Non-terminal updates (progress reports) for the same job are
+        coalesced over a short window and only the latest one is sent, so
+        a chatty job costs one frame per flush instead of one per update.
+        Terminal updates supersede any pending progress and go out
+        immediately.
+
+        Args:
+            job_id: Job ID
+            tenant_id: Tenant ID
+            user_id: User ID
+            status: Job status
+            result: Job result
+        """
+        if status == "processing":
+            self._pending_updates[job_id] = {
+                "job_id": job_id,
+                "tenant_id": tenant_id,
+                "user_id": user_id,
+                "status": status,
+                "result": result
+            }
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_pending_updates())
+            return
+
+        # Terminal update: anything still pending for this job is stale
+        self._pending_updates.pop(job_id, None)
+        await self._send_job_update(job_id, tenant_id, user_id, status, result)
+
+    async def _flush_pending_updates(self):
+        """
+        Send the latest coalesced update per job after the window elapses.
+        """
+        await asyncio.sleep(self._coalesce_interval)
+        self._flush_task = None
+        pending, self._pending_updates = self._pending_updates, {}
+        if pending:
+            await self.broadcast_job_updates_bulk(list(pending.values()))
+
+    async def _send_job_update(self, job_id: uuid.UUID, tenant_id: uuid.UUID, user_id: uuid.UUID,
+                               status: str, result: Optional[Dict[str, Any]] = None):
+        """
+        Resolve targets and enqueue a single job update.
+
         Args:
             job_id: Job ID
             tenant_id: Tenant ID
@@ -185,51 +379,102 @@ class ConnectionManager:
             "job_id": str(job_id),
             "status": status
         }
-        
+
         if result:
             message["result"] = result
-            
-        # Find all connections subscribed to this job
-        subscribed_connections = []
-        
+
+        # Collect subscribers via the per-job index plus the job owner's
+        # connections, deduplicated
         async with self._lock:
-            for connection, subscriptions in self.job_subscriptions.items():
-                if job_id in subscriptions:
-                    subscribed_connections.append(connection)
-                    
-        # Send message to all subscribed connections
-        for connection in subscribed_connections:
-            await self.send_personal_message(message, connection)
-            
-        # Also send to all connections of the job owner
-        await self.broadcast_to_user(message, tenant_id, user_id)
+            targets = set(self.job_subscribers.get(job_id.int, ()))
+            user_connections = self.by_user.get((tenant_id.int, user_id.int))
+            if user_connections:
+                targets.update(user_connections)
+
+        if not targets:
+            return
+
+        # Serialize (and compress, when worthwhile) once; every recipient's
+        # writer task picks up the same payload from its queue
+        payload = _encode_payload(message, len(targets))
+        for connection in targets:
+            self._enqueue(connection, payload)
+
+    async def broadcast_job_updates_bulk(self, updates: List[Dict[str, Any]]):
+        """
+        Broadcast several job updates at once.
+
+        Each payload is serialized once and all targets resolved under a
+        single lock acquisition, so emitting back-to-back updates (e.g.
+        final progress plus completion) costs one fan-out instead of one
+        per update.
+
+        Args:
+            updates: List of dicts with job_id, tenant_id, user_id, status
+                and optional result, mirroring broadcast_job_update
+        """
+        sends = []
+
+        async with self._lock:
+            for update in updates:
+                job_id = update["job_id"]
+                message = {
+                    "type": "job_update",
+                    "job_id": str(job_id),
+                    "status": update["status"]
+                }
+                if update.get("result"):
+                    message["result"] = update["result"]
+
+                targets = set(self.job_subscribers.get(job_id.int, ()))
+                user_connections = self.by_user.get(
+                    (update["tenant_id"].int, update["user_id"].int)
+                )
+                if user_connections:
+                    targets.update(user_connections)
+                if not targets:
+                    continue
+
+                payload = _encode_payload(message, len(targets))
+                sends.extend((connection, payload) for connection in targets)
+
+        for connection, payload in sends:
+            self._enqueue(connection, payload)
 
 
 # Create global connection manager instance
 connection_manager = ConnectionManager()
 
+# Small pool for signature verification on cache misses, keeping the
+# CPU work off the event loop during connection bursts
+_JWT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="ws-jwt"
+)
+
 
 async def get_token_data(token: str) -> Dict[str, Any]:
     """
     Get token data from JWT token.
-    
+
     Args:
         token: JWT token
-        
+
     Returns:
         Token data
-        
+
     Raises:
         HTTPException: If token is invalid
     """
+    # Shares the validated-payload cache with the HTTP middleware; only
+    # a miss pays for the executor round trip and the crypto
+    payload = get_cached_token(token)
+    if payload is not None:
+        return payload
+
     try:
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET_KEY, 
-            algorithms=[settings.JWT_ALGORITHM]
+        return await asyncio.get_running_loop().run_in_executor(
+            _JWT_EXECUTOR, decode_token, token
         )
-        
-        return payload
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
@@ -237,35 +482,35 @@ async def get_token_data(token: str) -> Dict[str, Any]:
 async def websocket_auth(websocket: WebSocket) -> Dict[str, Any]:
     """
     Authenticate WebSocket connection.
-    
+
     Args:
         websocket: WebSocket connection
-        
+
     Returns:
         Token data
-        
+
     Raises:
         WebSocketDisconnect: If authentication fails
     """
     try:
         # Get token from query parameters
         token = websocket.query_params.get("token")
-        
+
         if not token:
             # Try to get token from headers
             headers = dict(websocket.headers)
             auth_header = headers.get("authorization")
-            
+
             if auth_header and auth_header.startswith("Bearer "):
                 token = auth_header.split(" ")[1]
-                
+
         if not token:
             await websocket.close(code=1008, reason="Missing authentication token")
             raise WebSocketDisconnect(code=1008)
-            
+
         # Validate token
         token_data = await get_token_data(token)
-        
+
         return token_data
     except Exception as e:
         logger.error(f"WebSocket authentication error: {str(e)}")
@@ -2,13 +2,20 @@
 Main FastAPI application with multi-tenant support.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 import os
-import time
-import threading
+
+try:
+    # libuv-based event loop: significantly faster socket I/O for the
+    # websocket broadcast and job queue paths. Not available on Windows.
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
 
 from backend.db.db_instance import init_db
 from backend.routers.transcription.router import transcription_router, get_pipeline
@@ -28,20 +35,19 @@ from backend.routers.workflow.router import workflow_router
 from backend.routers.job import job_router
 from backend.routers.websocket import websocket_router
 from backend.job_queue import start_job_queue, stop_job_queue
-from backend.job_queue.handlers import register_handlers
+from backend.job_queue.handlers import register_handlers, get_transcription_pool
 
 
-def clean_cache_thread(ttl: int, frequency: int) -> threading.Thread:
-    def clean_cache(_ttl: int, _frequency: int):
-        while True:
-            cleanup_old_files(cache_dir=BACKEND_CACHE_DIR, ttl=_ttl)
-            time.sleep(_frequency)
+async def _cache_cleaner(ttl: int, frequency: int):
+    """
+    Periodically purge expired cache files without a dedicated thread.
 
-    return threading.Thread(
-        target=clean_cache,
-        args=(ttl, frequency),
-        daemon=True
-    )
+    The blocking filesystem walk runs in the default thread pool; the
+    scheduling itself shares the main event loop.
+    """
+    while True:
+        await asyncio.to_thread(cleanup_old_files, cache_dir=BACKEND_CACHE_DIR, ttl=ttl)
+        await asyncio.sleep(frequency)
 
 
 @asynccontextmanager
@@ -56,9 +62,14 @@ async def lifespan(app: FastAPI):
     vad_inferencer = get_vad_model()
     bgm_separation_inferencer = get_bgm_separation_inferencer()
 
-    # Thread initialization
-    cache_thread = clean_cache_thread(server_config["cache"]["ttl"], server_config["cache"]["frequency"])
-    cache_thread.start()
+    # Periodic cache cleanup on the shared event loop
+    cleanup_task = asyncio.create_task(
+        _cache_cleaner(server_config["cache"]["ttl"], server_config["cache"]["frequency"])
+    )
+
+    # Compute/I-O split: CPU-bound inference runs in this process pool
+    # while websocket fan-out and cache cleanup stay on the event loop
+    app.state.cpu_pool = get_transcription_pool()
 
     # Start job queue
     start_job_queue()
@@ -68,9 +79,15 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    # Stop cache cleanup
+    cleanup_task.cancel()
+
     # Stop job queue
     stop_job_queue()
 
+    # Tear down the compute pool without waiting on in-flight futures
+    app.state.cpu_pool.shutdown(wait=False, cancel_futures=True)
+
     # Release VRAM when server shutdown
     transcription_pipeline = None
     vad_inferencer = None
@@ -85,6 +102,8 @@ app = FastAPI(
     """,
     version="0.1.0",
     lifespan=lifespan,
+    # orjson serializes every response, handling datetime/UUID natively
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {
             "name": "Authentication",
@@ -166,4 +185,5 @@ async def index():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000,
+                loop="uvloop" if uvloop else "auto")
@@ -0,0 +1,115 @@
+"""
+Process-local cache for Tenant rows.
+
+Tenant records change rarely (plan, subscription status) but are read on
+every authenticated request, so a short TTL cache collapses the
+per-request tenant lookup to roughly one query per tenant per TTL.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+# Cached rows live this long before the next request re-reads the DB
+TENANT_CACHE_TTL = 30.0
+TENANT_CACHE_MAX = 10_000
+
+# Keys are normalized to str since callers hold tenant ids either as
+# uuid.UUID (path parameters) or str (token payloads)
+_tenant_cache: Dict[str, tuple] = {}
+
+
+def get_cached_tenant(tenant_id) -> Optional[Any]:
+    """
+    Get a cached tenant row if present and fresh.
+
+    Args:
+        tenant_id: Tenant ID (UUID or string)
+
+    Returns:
+        The cached tenant, or None on miss/expiry
+    """
+    key = str(tenant_id)
+    cached = _tenant_cache.get(key)
+    if cached is None:
+        return None
+    tenant, expires_at = cached
+    if time.monotonic() >= expires_at:
+        del _tenant_cache[key]
+        return None
+    return tenant
+
+
+def cache_tenant(tenant_id, tenant: Any):
+    """
+    Store a tenant row in the cache.
+
+    Args:
+        tenant_id: Tenant ID (UUID or string)
+        tenant: Tenant ORM object
+    """
+    if len(_tenant_cache) >= TENANT_CACHE_MAX:
+        now = time.monotonic()
+        for key in [k for k, (_, e) in _tenant_cache.items() if e <= now]:
+            del _tenant_cache[key]
+        if len(_tenant_cache) >= TENANT_CACHE_MAX:
+            _tenant_cache.clear()
+    _tenant_cache[str(tenant_id)] = (tenant, time.monotonic() + TENANT_CACHE_TTL)
+
+
+# Domain-keyed lookups (custom-domain resolution) get their own map so a
+# tenant can be found without knowing its id first
+_domain_cache: Dict[str, tuple] = {}
+
+
+def get_cached_tenant_by_domain(domain: str) -> Optional[Any]:
+    """
+    Get a cached tenant row by domain if present and fresh.
+
+    Args:
+        domain: Domain name
+
+    Returns:
+        The cached tenant, or None on miss/expiry
+    """
+    cached = _domain_cache.get(domain)
+    if cached is None:
+        return None
+    tenant, expires_at = cached
+    if time.monotonic() >= expires_at:
+        del _domain_cache[domain]
+        return None
+    return tenant
+
+
+def cache_tenant_by_domain(domain: str, tenant: Any):
+    """
+    Store a tenant row in the domain-keyed cache.
+
+    Args:
+        domain: Domain name
+        tenant: Tenant ORM object
+    """
+    if len(_domain_cache) >= TENANT_CACHE_MAX:
+        now = time.monotonic()
+        for key in [k for k, (_, e) in _domain_cache.items() if e <= now]:
+            del _domain_cache[key]
+        if len(_domain_cache) >= TENANT_CACHE_MAX:
+            _domain_cache.clear()
+    _domain_cache[domain] = (tenant, time.monotonic() + TENANT_CACHE_TTL)
+
+
+def invalidate_tenant(tenant_id):
+    """
+    Drop a tenant from the cache, e.g. after an update endpoint commits.
+
+    Args:
+        tenant_id: Tenant ID (UUID or string)
+    """
+    key = str(tenant_id)
+    _tenant_cache.pop(key, None)
+    # The domain map is small and invalidation is rare (update/delete
+    # endpoints only), so a scan for the matching entry is fine
+    for domain in [
+        d for d, (t, _) in _domain_cache.items() if str(t.id) == key
+    ]:
+        del _domain_cache[domain]
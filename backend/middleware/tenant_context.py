@@ -5,82 +5,189 @@ This middleware extracts tenant information from authentication tokens
 and adds it to the request state for use in API handlers.
 """
 
+import hashlib
+import re
+import time
+import uuid
+
 import jwt
 from fastapi import Request, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
 from backend.models.tenant import Tenant
-from backend.config import settings
+from backend.config import settings, JWT_PREPARED_KEY, JWT_ALGORITHM
+from backend.middleware.tenant_cache import get_cached_tenant, cache_tenant
 
 security = HTTPBearer()
 
-class TenantContextMiddleware(BaseHTTPMiddleware):
+# Paths exempt from tenant context, resolved with one frozenset lookup
+# plus one compiled-regex match instead of per-request list scans
+_SKIP_EXACT = frozenset({
+    "/api/auth/login",
+    "/api/auth/register",
+    "/api/auth/refresh",
+})
+_SKIP_PREFIX_RE = re.compile(r"^/api/public/")
+
+# Cache of validated token payloads so repeat requests from the same
+# client skip the signature verification. Entries expire with the token
+# (capped at the TTL below) and the cache is bounded in size. Keys are
+# 64-bit digests of the token rather than the ~500-byte JWS string, so
+# dict operations hash one machine word; a token-prefix sentinel stored
+# with each entry guards against digest collisions.
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_TTL = 60.0
+_token_cache: Dict[int, tuple] = {}
+
+
+def _token_cache_key(token: str) -> int:
+    """
+    Derive the fixed-width cache key for a token.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        64-bit integer digest of the token
+    """
+    return int.from_bytes(
+        hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+    )
+
+
+def get_cached_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up an already-validated token payload without any crypto work.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        The cached payload, or None on miss/expiry
+    """
+    key = _token_cache_key(token)
+    cached = _token_cache.get(key)
+    if cached is None:
+        return None
+    payload, expires_at, sentinel = cached
+    if sentinel != token[:16]:
+        return None
+    if time.time() >= expires_at:
+        del _token_cache[key]
+        return None
+    return payload
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, caching validated payloads.
+
+    The signature check is CPU-bound and identical for every request
+    carrying the same token, so validated payloads are cached keyed by
+    the token string until the token (or the cache TTL) expires.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        The decoded token payload
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid
+    """
+    now = time.time()
+    key = _token_cache_key(token)
+    cached = _token_cache.get(key)
+    if cached is not None:
+        payload, expires_at, sentinel = cached
+        if sentinel == token[:16] and now < expires_at:
+            return payload
+        del _token_cache[key]
+
+    # The verification key is prepared once at startup (see config)
+    payload = jwt.decode(
+        token,
+        JWT_PREPARED_KEY,
+        algorithms=[JWT_ALGORITHM]
+    )
+
+    ttl = _TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - now)
+    if ttl > 0:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            # Drop expired entries first; clear outright if still full
+            for stale in [k for k, (_, e, _s) in _token_cache.items() if e <= now]:
+                del _token_cache[stale]
+            if len(_token_cache) >= _TOKEN_CACHE_MAX:
+                _token_cache.clear()
+        _token_cache[key] = (payload, now + ttl, token[:16])
+
+    return payload
+
+class TenantContextMiddleware:
     """
     Middleware that extracts tenant information from JWT tokens
     and adds it to the request state.
+
+    Implemented as a pure ASGI callable rather than BaseHTTPMiddleware,
+    so each request skips the task-group and stream-bridging machinery
+    that the base class wraps around dispatch().
     """
-    
-    async def dispatch(self, request: Request, call_next):
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
         """
-        Process the request, extract tenant context, and call the next middleware.
-        
+        Process the request, extract tenant context, and call the app.
+
         Args:
-            request: The incoming request
-            call_next: The next middleware to call
-            
-        Returns:
-            The response from the next middleware
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        # Skip tenant context for authentication endpoints
-        if request.url.path in ["/api/auth/login", "/api/auth/register", "/api/auth/refresh"]:
-            return await call_next(request)
-            
-        # Skip tenant context for public endpoints
-        if request.url.path.startswith("/api/public/"):
-            return await call_next(request)
-            
-        # Extract token from authorization header
-        authorization = request.headers.get("Authorization")
-        if not authorization:
-            # No authorization header, continue without tenant context
-            return await call_next(request)
-            
-        try:
-            scheme, token = authorization.split()
-            if scheme.lower() != "bearer":
-                return await call_next(request)
-                
-            # Decode JWT token
-            payload = jwt.decode(
-                token, 
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            
-            # Extract tenant_id from token payload
-            tenant_id = payload.get("tenant_id")
-            if not tenant_id:
-                return await call_next(request)
-                
-            # Add tenant_id to request state
-            request.state.tenant_id = tenant_id
-            
-            # Add user_id to request state
-            request.state.user_id = payload.get("sub")
-            
-            # Add role to request state
-            request.state.role = payload.get("role", "user")
-            
-            # Process the request with tenant context
-            return await call_next(request)
-            
-        except (jwt.PyJWTError, ValueError):
-            # Invalid token, continue without tenant context
-            return await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Skip tenant context for authentication and public endpoints
+        path = scope["path"]
+        if path in _SKIP_EXACT or _SKIP_PREFIX_RE.match(path):
+            await self.app(scope, receive, send)
+            return
+
+        # Extract token from the raw authorization header
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+                break
+
+        if authorization:
+            try:
+                scheme, token = authorization.split()
+                if scheme.lower() == "bearer":
+                    # Decode JWT token (cached across requests with the
+                    # same token)
+                    payload = decode_token(token)
+
+                    tenant_id = payload.get("tenant_id")
+                    if tenant_id:
+                        # request.state is backed by scope["state"]
+                        state = scope.setdefault("state", {})
+                        state["tenant_id"] = tenant_id
+                        state["user_id"] = payload.get("sub")
+                        state["role"] = payload.get("role", "user")
+            except (jwt.PyJWTError, ValueError):
+                # Invalid token, continue without tenant context
+                pass
+
+        await self.app(scope, receive, send)
 
 
 async def get_tenant_id(request: Request) -> str:
@@ -123,14 +230,20 @@ async def get_current_tenant(
         HTTPException: If the tenant is not found or inactive
     """
     tenant_id = await get_tenant_id(request)
-    
-    tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
-    if not tenant:
-        raise HTTPException(
-            status_code=404,
-            detail="Tenant not found"
-        )
-        
+
+    # Tenant rows change rarely; serve from the short-TTL cache and only
+    # hit the database on miss or expiry
+    tenant = get_cached_tenant(tenant_id)
+    if tenant is None:
+        tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
+        if not tenant:
+            raise HTTPException(
+                status_code=404,
+                detail="Tenant not found"
+            )
+        cache_tenant(tenant_id, tenant)
+
+
     if tenant.subscription_status not in ["active", "trial"]:
         raise HTTPException(
             status_code=403,
@@ -176,10 +289,12 @@ def tenant_required(roles: Optional[list] = None):
                     detail=f"Role {user_role} not authorized. Required: {roles}"
                 )
                 
-        # Return tenant and user information
+        # Return tenant and user information; user_id is parsed to a UUID
+        # once here so handlers can compare and bind it without str() hops
+        user_id = getattr(request.state, "user_id", None)
         return {
             "tenant_id": tenant.id,
-            "user_id": getattr(request.state, "user_id", None),
+            "user_id": uuid.UUID(user_id) if user_id else None,
             "role": getattr(request.state, "role", None),
             "tenant": tenant
         }
@@ -4,7 +4,7 @@ Authentication models for multi-tenant support.
 
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 import uuid
 
 
@@ -20,9 +20,12 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     """
     Token data model for authentication.
+
+    IDs are parsed to UUIDs once here; downstream queries bind them
+    natively instead of round-tripping through strings.
     """
-    user_id: Optional[str] = None
-    tenant_id: Optional[str] = None
+    user_id: Optional[uuid.UUID] = None
+    tenant_id: Optional[uuid.UUID] = None
 
 
 class UserBase(BaseModel):
@@ -42,7 +45,8 @@ class UserCreate(UserBase):
     role: str = "user"
     tenant_id: uuid.UUID
 
-    @validator("role")
+    @field_validator("role")
+    @classmethod
     def validate_role(cls, v):
         """
         Validate role.
@@ -67,7 +71,10 @@ class UserResponse(BaseModel):
     User response model.
     """
     id: uuid.UUID
-    email: EmailStr
+    # Plain str: emails are validated on input and stored validated, so
+    # re-running the email validator on every response serialization is
+    # wasted work
+    email: str
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     role: str
@@ -75,5 +82,4 @@ class UserResponse(BaseModel):
     status: str
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -2,57 +2,245 @@
 Authentication router for multi-tenant support.
 """
 
+import asyncio
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
+import bcrypt
 import jwt
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from passlib.context import CryptContext
+from sqlalchemy import case, func, or_, update
 from sqlalchemy.orm import Session
 import uuid
 
 from backend.db.db_instance import get_db_session
 from backend.models.user import User
 from backend.models.tenant import Tenant
-from backend.utils.tenant_utils import get_tenant_by_domain
-from backend.config import settings
+from backend.config import (
+    settings,
+    JWT_PREPARED_KEY,
+    JWT_REFRESH_PREPARED_KEY,
+    JWT_ALGORITHM,
+)
+from backend.middleware.tenant_context import decode_token
 from .models import Token, TokenData, UserCreate, UserLogin, UserResponse
 
 auth_router = APIRouter()
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Shared encoder instance: the module-level jwt.encode helper constructs a
+# fresh PyJWT object on every call
+_jwt_encoder = jwt.PyJWT()
 
 # OAuth2 token URL
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
+# Refresh tokens are signed with a different secret, so they get their own
+# validated-payload cache; access tokens share the middleware's cache via
+# decode_token. Entries expire with the token, capped at the TTL below.
+_REFRESH_CACHE_MAX = 10_000
+_REFRESH_CACHE_TTL = 60.0
+_refresh_cache: Dict[str, tuple] = {}
+
+
+def _decode_refresh_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a refresh token, caching validated payloads.
+
+    Args:
+        token: Encoded refresh JWT
+
+    Returns:
+        The decoded token payload
+
+    Raises:
+        jwt.PyJWTError: If the token is invalid
+    """
+    now = time.time()
+    cached = _refresh_cache.get(token)
+    if cached is not None:
+        payload, expires_at = cached
+        if now < expires_at:
+            return payload
+        del _refresh_cache[token]
+
+    payload = jwt.decode(
+        token,
+        JWT_REFRESH_PREPARED_KEY,
+        algorithms=[JWT_ALGORITHM]
+    )
+
+    ttl = _REFRESH_CACHE_TTL
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - now)
+    if ttl > 0:
+        if len(_refresh_cache) >= _REFRESH_CACHE_MAX:
+            _refresh_cache.clear()
+        _refresh_cache[token] = (payload, now + ttl)
+
+    return payload
+
+
+@dataclass(slots=True)
+class UserSnapshot:
+    """
+    Detached copy of the User fields consumed by request handlers.
+
+    Returned by get_current_user on cache hits so authorization does not
+    need a Session-bound ORM row.
+    """
+    id: uuid.UUID
+    email: str
+    first_name: Optional[str]
+    last_name: Optional[str]
+    role: str
+    tenant_id: uuid.UUID
+    status: str
+    created_at: datetime
+
+
+# Short-TTL cache of active users keyed by (user_id, tenant_id) from the
+# token, removing the per-request SELECT on hot polling endpoints
+_USER_CACHE_MAX = 10_000
+_USER_CACHE_TTL = 10.0
+_user_cache: Dict[tuple, tuple] = {}
+
+
+def _invalidate_user(user_id, tenant_id):
+    """
+    Drop a user from the snapshot cache, e.g. after an account change.
+
+    Args:
+        user_id: User ID
+        tenant_id: Tenant ID
+    """
+    _user_cache.pop((str(user_id), str(tenant_id)), None)
+
+
+# last_login only needs coarse accuracy; skip the UPDATE entirely when the
+# same user logged in within the window below
+_LAST_LOGIN_DEBOUNCE = 60.0
+_last_login_touched: Dict[tuple, float] = {}
+
+
+def _touch_last_login(user_id, tenant_id):
+    """
+    Record a login timestamp outside the request/response cycle.
+
+    Runs as a background task so the login response isn't held up by a
+    second write transaction. Issues a single UPDATE instead of loading
+    and flushing the ORM row.
+
+    Args:
+        user_id: User ID
+        tenant_id: Tenant ID
+    """
+    key = (str(user_id), str(tenant_id))
+    now = time.monotonic()
+    last = _last_login_touched.get(key)
+    if last is not None and now - last < _LAST_LOGIN_DEBOUNCE:
+        return
+    if len(_last_login_touched) >= 10_000:
+        _last_login_touched.clear()
+    _last_login_touched[key] = now
+
+    session = get_db_session()
+    try:
+        session.execute(
+            update(User)
+            .where(User.id == user_id, User.tenant_id == tenant_id)
+            .values(last_login=func.now())
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+# Argon2id (OWASP-recommended parameters) for new hashes; legacy bcrypt
+# hashes keep verifying and are upgraded opportunistically on login
+_ph = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against a hash.
-    
+
+    Handles both Argon2id hashes and legacy bcrypt hashes.
+
     Args:
         plain_password: Plain text password
         hashed_password: Hashed password
-        
+
     Returns:
         True if the password matches the hash
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _ph.verify(hashed_password, plain_password)
+        except VerifyMismatchError:
+            return False
+    return bcrypt.checkpw(
+        plain_password.encode("utf-8"),
+        hashed_password.encode("utf-8")
+    )
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a password.
-    
+    Hash a password with Argon2id.
+
     Args:
         password: Plain text password
-        
+
     Returns:
         Hashed password
     """
-    return pwd_context.hash(password)
+    return _ph.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be upgraded to current parameters.
+
+    Args:
+        hashed_password: Stored password hash
+
+    Returns:
+        True for legacy bcrypt hashes or outdated Argon2 parameters
+    """
+    if not hashed_password.startswith("$argon2"):
+        return True
+    return _ph.check_needs_rehash(hashed_password)
+
+
+def _rehash_password(user_id, tenant_id, password: str):
+    """
+    Upgrade a stored hash after a successful login.
+
+    Runs as a background task with its own short-lived session so the
+    login response isn't held up by a second Argon2 pass plus a write.
+
+    Args:
+        user_id: User ID
+        tenant_id: Tenant ID
+        password: The verified plain text password
+    """
+    new_hash = _ph.hash(password)
+    session = get_db_session()
+    try:
+        session.execute(
+            update(User)
+            .where(User.id == user_id, User.tenant_id == tenant_id)
+            .values(password_hash=new_hash)
+        )
+        session.commit()
+    finally:
+        session.close()
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -67,20 +255,23 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         JWT token
     """
     to_encode = data.copy()
-    
+
+    # exp is an integer epoch timestamp in the end; computing it directly
+    # skips the datetime construction and the conversion inside PyJWT
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time() + expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        
+        expire = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
     to_encode.update({"exp": expire})
-    
-    encoded_jwt = jwt.encode(
-        to_encode, 
-        settings.JWT_SECRET_KEY, 
-        algorithm=settings.JWT_ALGORITHM
+
+
+    encoded_jwt = _jwt_encoder.encode(
+        to_encode,
+        JWT_PREPARED_KEY,
+        algorithm=JWT_ALGORITHM
     )
-    
+
     return encoded_jwt
 
 
@@ -95,29 +286,30 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
         JWT token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     to_encode.update({"exp": expire})
-    
-    encoded_jwt = jwt.encode(
-        to_encode, 
-        settings.JWT_REFRESH_SECRET_KEY, 
-        algorithm=settings.JWT_ALGORITHM
+
+
+    encoded_jwt = _jwt_encoder.encode(
+        to_encode,
+        JWT_REFRESH_PREPARED_KEY,
+        algorithm=JWT_ALGORITHM
     )
     
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db_session)) -> User:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db_session)) -> UserSnapshot:
     """
     Get the current user from a JWT token.
-    
+
     Args:
         token: JWT token
         db: Database session
-        
+
     Returns:
-        User object
-        
+        UserSnapshot with the authenticated user's fields
+
     Raises:
         HTTPException: If the token is invalid or the user is not found
     """
@@ -126,50 +318,74 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     try:
-        payload = jwt.decode(
-            token, 
-            settings.JWT_SECRET_KEY, 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        
+        # Cached across requests carrying the same token (shared with the
+        # tenant-context middleware)
+        payload = decode_token(token)
+
         user_id: str = payload.get("sub")
         tenant_id: str = payload.get("tenant_id")
-        
+
         if user_id is None or tenant_id is None:
             raise credentials_exception
-            
+
         token_data = TokenData(user_id=user_id, tenant_id=tenant_id)
     except jwt.PyJWTError:
         raise credentials_exception
-        
+
+    # Serve repeat requests from the snapshot cache; only active users are
+    # cached, so a deactivated account is re-checked on every request
+    cache_key = (user_id, tenant_id)
+    cached = _user_cache.get(cache_key)
+    if cached is not None:
+        snapshot, expires_at = cached
+        if time.monotonic() < expires_at:
+            return snapshot
+        del _user_cache[cache_key]
+
     user = db.query(User).filter(
         User.id == token_data.user_id,
         User.tenant_id == token_data.tenant_id
     ).first()
-    
+
     if user is None:
         raise credentials_exception
-        
+
     if user.status != "active":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is not active"
         )
-        
-    return user
+
+    snapshot = UserSnapshot(
+        id=user.id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        role=user.role,
+        tenant_id=user.tenant_id,
+        status=user.status,
+        created_at=user.created_at
+    )
+    if len(_user_cache) >= _USER_CACHE_MAX:
+        _user_cache.clear()
+    _user_cache[cache_key] = (snapshot, time.monotonic() + _USER_CACHE_TTL)
+
+    return snapshot
 
 
 @auth_router.post("/token", response_model=Token)
 async def login_for_access_token(
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db_session)
 ):
     """
     Get an access token using username and password.
-    
+
     Args:
+        background_tasks: FastAPI background task queue
         form_data: OAuth2 password request form
         db: Database session
         
@@ -179,46 +395,56 @@ async def login_for_access_token(
     Raises:
         HTTPException: If the username or password is incorrect
     """
-    # Split email to get domain for tenant lookup
-    email_parts = form_data.username.split("@")
-    if len(email_parts) != 2:
+    # Parse the email in one pass and case-fold once so the DB comparison
+    # is exact without runtime case handling
+    email = form_data.username.lower()
+    local, sep, domain = email.rpartition("@")
+    if not sep or not local or "@" in local:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid email format"
         )
-        
-    email, domain = email_parts
-    
-    # Try to find tenant by domain
-    tenant = get_tenant_by_domain(db, domain)
-    
-    if not tenant:
-        # If tenant not found by domain, use default tenant
-        tenant = db.query(Tenant).filter(Tenant.id == settings.DEFAULT_TENANT_ID).first()
-        
-        if not tenant:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Tenant not found"
-            )
-    
-    # Find user by email and tenant
-    user = db.query(User).filter(
-        User.email == form_data.username,
-        User.tenant_id == tenant.id
-    ).first()
-    
-    if not user or not verify_password(form_data.password, user.password_hash):
+
+    # Resolve tenant and user in a single round trip: prefer the tenant
+    # matching the email domain, fall back to the default tenant
+    user = (
+        db.query(User)
+        .join(Tenant, User.tenant_id == Tenant.id)
+        .filter(User.email == email)
+        .filter(or_(
+            Tenant.domain == domain,
+            Tenant.id == settings.DEFAULT_TENANT_ID
+        ))
+        .order_by(case((Tenant.domain == domain, 0), else_=1))
+        .first()
+    )
+
+    # All reads are done; return the connection to the pool now instead of
+    # holding it across the ~100ms bcrypt check (the last_login write runs
+    # later on its own short-lived session)
+    db.close()
+
+    # bcrypt takes ~100ms by design; run it off the event loop so login
+    # attempts don't stall every other request
+    if not user or not await asyncio.to_thread(
+        verify_password, form_data.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-        
-    # Update last login
-    user.last_login = datetime.utcnow()
-    db.commit()
-    
+
+    # Update last login after the response is sent
+    background_tasks.add_task(_touch_last_login, user.id, user.tenant_id)
+
+    # Opportunistic migration: upgrade legacy/outdated hashes now that
+    # the plaintext has been verified
+    if password_needs_rehash(user.password_hash):
+        background_tasks.add_task(
+            _rehash_password, user.id, user.tenant_id, form_data.password
+        )
+
     # Create tokens
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -229,14 +455,14 @@ async def login_for_access_token(
         },
         expires_delta=access_token_expires
     )
-    
+
     refresh_token = create_refresh_token(
         data={
             "sub": str(user.id),
             "tenant_id": str(user.tenant_id)
         }
     )
-    
+
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -278,13 +504,9 @@ async def refresh_token(
         if scheme.lower() != "bearer":
             raise credentials_exception
             
-        # Decode refresh token
-        payload = jwt.decode(
-            token, 
-            settings.JWT_REFRESH_SECRET_KEY, 
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        
+        # Decode refresh token (cached until the token expires)
+        payload = _decode_refresh_token(token)
+
         user_id: str = payload.get("sub")
         tenant_id: str = payload.get("tenant_id")
         
@@ -299,15 +521,18 @@ async def refresh_token(
         User.tenant_id == tenant_id
     ).first()
     
+    # Read-only endpoint: release the connection before token signing
+    db.close()
+
     if user is None:
         raise credentials_exception
-        
+
     if user.status != "active":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is not active"
         )
-        
+
     # Create new tokens
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -359,23 +584,27 @@ async def register_user(
             detail="Tenant not found"
         )
         
+    # Emails are stored lowercased so login comparisons stay exact
+    email = user_data.email.lower()
+
     # Check if email is already registered for this tenant
     existing_user = db.query(User).filter(
-        User.email == user_data.email,
+        User.email == email,
         User.tenant_id == user_data.tenant_id
     ).first()
-    
+
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
         
-    # Create user
-    hashed_password = get_password_hash(user_data.password)
+    # Create user (hashing runs off the event loop; it costs as much as a
+    # verification by design)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     
     user = User(
-        email=user_data.email,
+        email=email,
         password_hash=hashed_password,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
@@ -386,7 +615,10 @@ async def register_user(
     db.add(user)
     db.commit()
     db.refresh(user)
-    
+
+    # Drop any stale snapshot for this identity
+    _invalidate_user(user.id, user.tenant_id)
+
     return UserResponse(
         id=user.id,
         email=user.email,
@@ -402,13 +634,15 @@ async def register_user(
 @auth_router.post("/login", response_model=Token)
 async def login(
     user_data: UserLogin,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db_session)
 ):
     """
     Login with email and password.
-    
+
     Args:
         user_data: User login data
+        background_tasks: FastAPI background task queue
         db: Database session
         
     Returns:
@@ -417,23 +651,36 @@ async def login(
     Raises:
         HTTPException: If the email or password is incorrect
     """
-    # Find user by email and tenant
+    # Find user by email and tenant (emails are stored lowercased)
     user = db.query(User).filter(
-        User.email == user_data.email,
+        User.email == user_data.email.lower(),
         User.tenant_id == user_data.tenant_id
     ).first()
-    
-    if not user or not verify_password(user_data.password, user.password_hash):
+
+    # Return the connection to the pool before the slow bcrypt check; the
+    # last_login write runs later on its own short-lived session
+    db.close()
+
+    # Run the deliberately slow bcrypt check off the event loop
+    if not user or not await asyncio.to_thread(
+        verify_password, user_data.password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-        
-    # Update last login
-    user.last_login = datetime.utcnow()
-    db.commit()
-    
+
+    # Update last login after the response is sent
+    background_tasks.add_task(_touch_last_login, user.id, user.tenant_id)
+
+    # Opportunistic migration: upgrade legacy/outdated hashes now that
+    # the plaintext has been verified
+    if password_needs_rehash(user.password_hash):
+        background_tasks.add_task(
+            _rehash_password, user.id, user.tenant_id, user_data.password
+        )
+
     # Create tokens
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
@@ -460,7 +707,7 @@ async def login(
 
 
 @auth_router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: UserSnapshot = Depends(get_current_user)):
     """
     Get information about the current user.
     
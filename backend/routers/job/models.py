@@ -9,6 +9,10 @@ import uuid
 
 from backend.routers.workflow.models import WorkflowResponse
 
+# Hoisted so validation does an O(1) membership check without rebuilding
+# the list on every call
+_ALLOWED_STATUSES = frozenset(("queued", "processing", "completed", "failed", "canceled"))
+
 
 class JobBase(BaseModel):
     """
@@ -50,10 +54,8 @@ class JobUpdate(BaseModel):
         """
         Validate status.
         """
-        if v is not None:
-            allowed_statuses = ["queued", "processing", "completed", "failed", "canceled"]
-            if v not in allowed_statuses:
-                raise ValueError(f"Status must be one of {allowed_statuses}")
+        if v is not None and v not in _ALLOWED_STATUSES:
+            raise ValueError(f"Status must be one of {sorted(_ALLOWED_STATUSES)}")
         return v
 
 
@@ -6,8 +6,9 @@ import logging
 import uuid
 from typing import List, Optional, Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query, Response
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session, joinedload
 
 from backend.db.db_instance import get_db_session
 from backend.models.workflow import Job
@@ -15,11 +16,9 @@ from backend.middleware.tenant_context import tenant_required
 from backend.utils.tenant_utils import (
     get_tenant_record_or_404,
     get_tenant_records,
-    create_tenant_record,
-    update_tenant_record,
     delete_tenant_record
 )
-from backend.job_queue import enqueue_job
+from backend.job_queue import enqueue_job, QueueFullError
 from .models import (
     JobCreate,
     JobUpdate,
@@ -28,13 +27,52 @@ from .models import (
     JobStatusResponse
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the app entry point; importing a router must
+# not mutate the root logger
 logger = logging.getLogger(__name__)
 
 job_router = APIRouter()
 
 
+def get_job_for_user(db: Session, job_id: uuid.UUID, tenant_id, user_id, role: str, *options) -> Job:
+    """
+    Fetch a job with the tenant and ownership checks folded into the query.
+
+    Non-admin callers only match rows they own, so authorization costs no
+    extra predicate evaluation or UUID stringification in Python. A job
+    that exists but belongs to another user is indistinguishable from a
+    missing one and surfaces as 404, which also avoids confirming foreign
+    job IDs.
+
+    Args:
+        db: Database session
+        job_id: Job ID
+        tenant_id: Tenant ID
+        user_id: Requesting user's ID
+        role: Requesting user's role
+        *options: Loader options (e.g. joinedload) applied to the query
+
+    Returns:
+        The job
+
+    Raises:
+        HTTPException: If no accessible job matches
+    """
+    stmt = select(Job).where(Job.id == job_id, Job.tenant_id == tenant_id)
+    if options:
+        stmt = stmt.options(*options)
+    if role != "admin":
+        stmt = stmt.where(Job.user_id == user_id)
+
+    job = db.execute(stmt).scalar_one_or_none()
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
+
+
 @job_router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
 async def create_job(
     job_data: JobCreate,
@@ -65,38 +103,42 @@ async def create_job(
         )
         
         # Check if user has access to the workflow
-        if not workflow.is_public and str(workflow.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
+        if not workflow.is_public and workflow.user_id != auth["user_id"] and auth["role"] != "admin":
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to use this workflow"
             )
     
-    # Create job with tenant context
-    job = create_tenant_record(
-        db=db,
-        model=Job,
-        data={
-            "workflow_id": job_data.workflow_id,
-            "file_path": job_data.file_path,
-            "status": "queued",
-            "user_id": auth["user_id"]
-        },
-        tenant_id=auth["tenant_id"]
-    )
-    
-    # Enqueue job for processing
-    enqueue_job(job.id, auth["tenant_id"], job_data.priority)
-    
-    return JobResponse(
-        id=job.id,
-        tenant_id=job.tenant_id,
-        user_id=job.user_id,
-        workflow_id=job.workflow_id,
-        status=job.status,
-        file_path=job.file_path,
-        result_path=job.result_path,
-        created_at=job.created_at
-    )
+    # Create job with tenant context; RETURNING hands back the full row
+    # in the same round trip as the INSERT, skipping the refresh SELECT
+    job = db.execute(
+        insert(Job)
+        .values(
+            workflow_id=job_data.workflow_id,
+            file_path=job_data.file_path,
+            status="queued",
+            user_id=auth["user_id"],
+            tenant_id=auth["tenant_id"]
+        )
+        .returning(Job)
+    ).scalar_one()
+    db.commit()
+
+
+    # Enqueue job for processing. This stays on the request path on
+    # purpose: the queue is in-process (a non-blocking call_soon onto the
+    # queue loop, no broker round trip) and the synchronous call is what
+    # lets a full queue surface as 429 instead of a silently lost job.
+    try:
+        enqueue_job(job.id, auth["tenant_id"], job_data.priority)
+    except QueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Job queue is full, please retry later"
+        )
+
+    # response_model serializes the ORM row via orm_mode
+    return job
 
 
 @job_router.get("/", response_model=List[JobResponse])
@@ -122,24 +164,36 @@ async def get_jobs(
     Returns:
         List of jobs
     """
-    # Build query
-    query = db.query(Job).filter(Job.tenant_id == auth["tenant_id"])
-    
+    # Build a Core select of just the response columns; list rows never
+    # need ORM identity tracking or full-entity hydration
+    stmt = select(
+        Job.id,
+        Job.tenant_id,
+        Job.user_id,
+        Job.workflow_id,
+        Job.status,
+        Job.file_path,
+        Job.result_path,
+        Job.created_at
+    ).where(Job.tenant_id == auth["tenant_id"])
+
     # Apply filters
     if status:
-        query = query.filter(Job.status == status)
-    
+        stmt = stmt.where(Job.status == status)
+
     if workflow_id:
-        query = query.filter(Job.workflow_id == workflow_id)
-    
+        stmt = stmt.where(Job.workflow_id == workflow_id)
+
     # Filter by user if not admin
     if auth["role"] != "admin":
-        query = query.filter(Job.user_id == auth["user_id"])
-    
-    # Get jobs
-    jobs = query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return jobs
+        stmt = stmt.where(Job.user_id == auth["user_id"])
+
+    # Get jobs as plain mappings; response_model validates them directly
+    rows = db.execute(
+        stmt.order_by(Job.created_at.desc()).offset(skip).limit(limit)
+    ).mappings().all()
+
+    return rows
 
 
 @job_router.get("/{job_id}", response_model=JobDetailResponse)
@@ -162,105 +216,92 @@ async def get_job(
     Raises:
         HTTPException: If the job is not found or the user is not authorized
     """
-    # Get job with tenant isolation
-    job = get_tenant_record_or_404(
-        db=db,
-        model=Job,
-        record_id=job_id,
-        tenant_id=auth["tenant_id"]
-    )
-    
-    # Check if user has access to the job
-    if str(job.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this job"
-        )
-    
-    return JobDetailResponse(
-        id=job.id,
-        tenant_id=job.tenant_id,
-        user_id=job.user_id,
-        workflow_id=job.workflow_id,
-        status=job.status,
-        file_path=job.file_path,
-        result_path=job.result_path,
-        error=job.error,
-        processing_time=job.processing_time,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
-        completed_at=job.completed_at,
-        workflow=job.workflow
+    # Tenant isolation and ownership in a single query; the workflow is a
+    # to-one relation, so joinedload returns it in the same round trip
+    # instead of a lazy SELECT during response serialization
+    job = get_job_for_user(
+        db, job_id, auth["tenant_id"], auth["user_id"], auth["role"],
+        joinedload(Job.workflow)
     )
 
+    # response_model serializes the ORM row via orm_mode
+    return job
+
 
 @job_router.get("/{job_id}/status", response_model=JobStatusResponse)
 async def get_job_status(
     job_id: uuid.UUID,
     response: Response,
     etag: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
 ):
     """
     Get job status.
-    
+
     Args:
         job_id: Job ID
         response: Response object
         etag: ETag for conditional request
+        if_none_match: Standard conditional-request header, same semantics
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         Job status
-        
+
     Raises:
         HTTPException: If the job is not found or the user is not authorized
     """
-    # Get job with tenant isolation
-    job = get_tenant_record_or_404(
-        db=db,
-        model=Job,
-        record_id=job_id,
-        tenant_id=auth["tenant_id"]
-    )
-    
-    # Check if user has access to the job
-    if str(job.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
+    # This is the hottest endpoint in the router (clients poll it every
+    # few seconds), so fetch only the columns the response needs instead
+    # of hydrating the full ORM entity
+    stmt = select(
+        Job.id, Job.status, Job.result_path, Job.error, Job.updated_at
+    ).where(Job.id == job_id, Job.tenant_id == auth["tenant_id"])
+    if auth["role"] != "admin":
+        # Ownership folded into the query; see get_job_for_user
+        stmt = stmt.where(Job.user_id == auth["user_id"])
+
+    row = db.execute(stmt).first()
+
+    if row is None:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this job"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
         )
-    
-    # Generate ETag based on job status and updated_at
-    current_etag = f"\"{job.status}_{job.updated_at.isoformat()}\""
-    
+
+    # Generate ETag from the status initial plus the update time in epoch
+    # milliseconds: unique per state change, no isoformat allocations
+    current_etag = f'W/"{row.status[0]}{int(row.updated_at.timestamp() * 1000):x}"'
+
     # Set ETag header
     response.headers["ETag"] = current_etag
-    
-    # Check if ETag matches
-    if etag and etag == current_etag:
-        # Return 304 Not Modified if ETag matches
+
+    # Return 304 Not Modified without building a body if the client is
+    # already current (the common case while a job is processing)
+    client_etag = if_none_match or etag
+    if client_etag and client_etag == current_etag:
         response.status_code = status.HTTP_304_NOT_MODIFIED
         return None
-    
+
     # Prepare result
     result = None
-    if job.status == "completed" and job.result_path:
+    if row.status == "completed" and row.result_path:
         result = {
-            "path": job.result_path
+            "path": row.result_path
         }
-    elif job.status == "failed" and job.error:
+    elif row.status == "failed" and row.error:
         result = {
-            "error": job.error
+            "error": row.error
         }
-    
+
     return JobStatusResponse(
-        id=job.id,
-        status=job.status,
+        id=row.id,
+        status=row.status,
         result=result,
-        updated_at=job.updated_at
+        updated_at=row.updated_at
     )
 
 
@@ -284,21 +325,9 @@ async def cancel_job(
     Raises:
         HTTPException: If the job is not found, the user is not authorized, or the job cannot be canceled
     """
-    # Get job with tenant isolation
-    job = get_tenant_record_or_404(
-        db=db,
-        model=Job,
-        record_id=job_id,
-        tenant_id=auth["tenant_id"]
-    )
-    
-    # Check if user has access to the job
-    if str(job.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to cancel this job"
-        )
-    
+    # Tenant isolation and ownership in a single query
+    job = get_job_for_user(db, job_id, auth["tenant_id"], auth["user_id"], auth["role"])
+
     # Check if job can be canceled
     if job.status not in ["queued", "processing"]:
         raise HTTPException(
@@ -306,35 +335,23 @@ async def cancel_job(
             detail=f"Job cannot be canceled in status: {job.status}"
         )
     
-    # Update job status
-    job_data = {
-        "status": "canceled"
-    }
-    
-    updated_job = update_tenant_record(
-        db=db,
-        model=Job,
-        record_id=job_id,
-        data=job_data,
-        tenant_id=auth["tenant_id"]
-    )
-    
+    # Update job status; RETURNING folds the refresh SELECT into the UPDATE
+    updated_job = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.tenant_id == auth["tenant_id"])
+        .values(status="canceled")
+        .returning(Job)
+    ).scalar_one_or_none()
+    db.commit()
+
     if not updated_job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found"
         )
     
-    return JobResponse(
-        id=updated_job.id,
-        tenant_id=updated_job.tenant_id,
-        user_id=updated_job.user_id,
-        workflow_id=updated_job.workflow_id,
-        status=updated_job.status,
-        file_path=updated_job.file_path,
-        result_path=updated_job.result_path,
-        created_at=updated_job.created_at
-    )
+    # response_model serializes the ORM row via orm_mode
+    return updated_job
 
 
 @job_router.put("/{job_id}/retry", response_model=JobResponse)
@@ -357,21 +374,9 @@ async def retry_job(
     Raises:
         HTTPException: If the job is not found, the user is not authorized, or the job cannot be retried
     """
-    # Get job with tenant isolation
-    job = get_tenant_record_or_404(
-        db=db,
-        model=Job,
-        record_id=job_id,
-        tenant_id=auth["tenant_id"]
-    )
-    
-    # Check if user has access to the job
-    if str(job.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to retry this job"
-        )
-    
+    # Tenant isolation and ownership in a single query
+    job = get_job_for_user(db, job_id, auth["tenant_id"], auth["user_id"], auth["role"])
+
     # Check if job can be retried
     if job.status not in ["failed", "canceled"]:
         raise HTTPException(
@@ -379,20 +384,15 @@ async def retry_job(
             detail=f"Job cannot be retried in status: {job.status}"
         )
     
-    # Update job status
-    job_data = {
-        "status": "queued",
-        "error": None
-    }
-    
-    updated_job = update_tenant_record(
-        db=db,
-        model=Job,
-        record_id=job_id,
-        data=job_data,
-        tenant_id=auth["tenant_id"]
-    )
-    
+    # Update job status; RETURNING folds the refresh SELECT into the UPDATE
+    updated_job = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.tenant_id == auth["tenant_id"])
+        .values(status="queued", error=None)
+        .returning(Job)
+    ).scalar_one_or_none()
+    db.commit()
+
     if not updated_job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -400,15 +400,13 @@ async def retry_job(
         )
     
     # Enqueue job for processing
-    enqueue_job(updated_job.id, auth["tenant_id"])
+    try:
+        enqueue_job(updated_job.id, auth["tenant_id"])
+    except QueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Job queue is full, please retry later"
+        )
     
-    return JobResponse(
-        id=updated_job.id,
-        tenant_id=updated_job.tenant_id,
-        user_id=updated_job.user_id,
-        workflow_id=updated_job.workflow_id,
-        status=updated_job.status,
-        file_path=updated_job.file_path,
-        result_path=updated_job.result_path,
-        created_at=updated_job.created_at
-    )
+    # response_model serializes the ORM row via orm_mode
+    return updated_job
@@ -3,8 +3,8 @@ Reseller models for multi-tenant support.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, EmailStr, Field, validator
+from typing import Annotated, Literal, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 import uuid
 
 
@@ -15,27 +15,12 @@ class ResellerBase(BaseModel):
     name: str
     email: EmailStr
     phone: Optional[str] = None
-    commission_rate: int = 0  # Stored as percentage * 100 (e.g., 15.5% = 1550)
-    status: str = "active"
-
-    @validator("commission_rate")
-    def validate_commission_rate(cls, v):
-        """
-        Validate commission rate.
-        """
-        if v < 0 or v > 10000:  # 0% to 100%
-            raise ValueError("Commission rate must be between 0 and 10000 (0% to 100%)")
-        return v
-
-    @validator("status")
-    def validate_status(cls, v):
-        """
-        Validate status.
-        """
-        allowed_statuses = ["active", "suspended", "inactive"]
-        if v not in allowed_statuses:
-            raise ValueError(f"Status must be one of {allowed_statuses}")
-        return v
+    # Stored as percentage * 100 (e.g., 15.5% = 1550); bounds are checked
+    # inside pydantic-core instead of a Python validator callback
+    commission_rate: Annotated[int, Field(ge=0, le=10000)] = 0
+    # Literal: membership is checked inside pydantic-core instead of a
+    # Python validator callback per request
+    status: Literal["active", "suspended", "inactive"] = "active"
 
 
 class ResellerCreate(ResellerBase):
@@ -52,28 +37,8 @@ class ResellerUpdate(BaseModel):
     name: Optional[str] = None
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
-    commission_rate: Optional[int] = None
-    status: Optional[str] = None
-
-    @validator("commission_rate")
-    def validate_commission_rate(cls, v):
-        """
-        Validate commission rate.
-        """
-        if v is not None and (v < 0 or v > 10000):  # 0% to 100%
-            raise ValueError("Commission rate must be between 0 and 10000 (0% to 100%)")
-        return v
-
-    @validator("status")
-    def validate_status(cls, v):
-        """
-        Validate status.
-        """
-        if v is not None:
-            allowed_statuses = ["active", "suspended", "inactive"]
-            if v not in allowed_statuses:
-                raise ValueError(f"Status must be one of {allowed_statuses}")
-        return v
+    commission_rate: Annotated[Optional[int], Field(ge=0, le=10000)] = None
+    status: Optional[Literal["active", "suspended", "inactive"]] = None
 
 
 class ResellerResponse(BaseModel):
@@ -82,14 +47,17 @@ class ResellerResponse(BaseModel):
     """
     id: uuid.UUID
     name: str
-    email: EmailStr
+    # Plain str: emails are validated on input and stored validated, so
+    # responses skip the email validator
+    email: str
     phone: Optional[str] = None
     commission_rate: int
     status: str
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    # Frozen: response instances hold trusted DB data and are never
+    # mutated after construction, so skip the assignment machinery
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class ResellerDetailResponse(ResellerResponse):
@@ -139,8 +107,9 @@ class BrandingConfigurationResponse(BrandingConfigurationBase):
     reseller_id: uuid.UUID
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    # Frozen: response instances hold trusted DB data and are never
+    # mutated after construction, so skip the assignment machinery
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class SubscriptionPlanBase(BaseModel):
@@ -186,5 +155,6 @@ class SubscriptionPlanResponse(SubscriptionPlanBase):
     reseller_id: uuid.UUID
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    # Frozen: response instances hold trusted DB data and are never
+    # mutated after construction, so skip the assignment machinery
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
@@ -4,12 +4,17 @@ Reseller router for multi-tenant support.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import exists, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
 import uuid
 
 from backend.db.db_instance import get_db_session
 from backend.models.tenant import Reseller, Tenant, BrandingConfiguration, SubscriptionPlan
 from backend.middleware.tenant_context import tenant_required
+from backend.utils.ref_cache import invalidate_branding_configurations
 from .models import (
     ResellerCreate,
     ResellerUpdate,
@@ -25,12 +30,46 @@ from .models import (
 
 reseller_router = APIRouter()
 
+# Built once at import: every endpoint here requires the admin role, and
+# reusing one dependency object lets FastAPI share its resolved cache key
+# instead of constructing a fresh closure per route
+admin_required = tenant_required(["admin"])
+
+# List adapters built once at import: the validation and serialization
+# schemas for these generic aliases are compiled here instead of being
+# resolved by FastAPI on every request
+_RESELLER_LIST = TypeAdapter(List[ResellerResponse])
+_BRANDING_LIST = TypeAdapter(List[BrandingConfigurationResponse])
+_PLAN_LIST = TypeAdapter(List[SubscriptionPlanResponse])
+
+
+def _list_response(adapter: TypeAdapter, items: list, total: int) -> ORJSONResponse:
+    """
+    Serialize a list of ORM rows through a pre-built adapter.
+
+    Bypasses FastAPI's per-request response_model validation; the adapter
+    does one validate + dump pass and orjson encodes the result.
+
+    Args:
+        adapter: Pre-built list TypeAdapter
+        items: ORM rows to serialize
+        total: Filtered total for the X-Total-Count header
+
+    Returns:
+        The encoded response
+    """
+    payload = adapter.dump_python(
+        adapter.validate_python(items, from_attributes=True),
+        mode="json"
+    )
+    return ORJSONResponse(payload, headers={"X-Total-Count": str(total)})
+
 
 @reseller_router.post("/", response_model=ResellerResponse, status_code=status.HTTP_201_CREATED)
 async def create_reseller(
     reseller_data: ResellerCreate,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Create a new reseller.
@@ -46,50 +85,49 @@ async def create_reseller(
     Raises:
         HTTPException: If the email is already registered
     """
-    # Check if email is already registered
-    existing_reseller = db.query(Reseller).filter(Reseller.email == reseller_data.email).first()
-    if existing_reseller:
+    # Create reseller; RETURNING hands back the full row (including
+    # server defaults) in the same round trip, skipping the refresh
+    # SELECT. Duplicate emails are left to the unique constraint rather
+    # than a racy pre-check SELECT.
+    try:
+        reseller = db.execute(
+            insert(Reseller)
+            .values(
+                name=reseller_data.name,
+                email=reseller_data.email,
+                phone=reseller_data.phone,
+                commission_rate=reseller_data.commission_rate,
+                status=reseller_data.status
+            )
+            .returning(Reseller)
+        ).scalar_one()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
-    
-    # Create reseller
-    reseller = Reseller(
-        name=reseller_data.name,
-        email=reseller_data.email,
-        phone=reseller_data.phone,
-        commission_rate=reseller_data.commission_rate,
-        status=reseller_data.status
-    )
-    
-    db.add(reseller)
-    db.commit()
-    db.refresh(reseller)
-    
-    return ResellerResponse(
-        id=reseller.id,
-        name=reseller.name,
-        email=reseller.email,
-        phone=reseller.phone,
-        commission_rate=reseller.commission_rate,
-        status=reseller.status,
-        created_at=reseller.created_at
-    )
+
+    # response_model serializes the ORM row via orm_mode
+    return reseller
 
 
-@reseller_router.get("/", response_model=List[ResellerResponse])
+@reseller_router.get("/")
 async def get_resellers(
     skip: int = 0,
     limit: int = 100,
     name: Optional[str] = None,
     status: Optional[str] = None,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Get all resellers.
-    
+
+    The filtered total is returned in the X-Total-Count header so clients
+    can paginate without a second COUNT query.
+
     Args:
         skip: Number of resellers to skip
         limit: Maximum number of resellers to return
@@ -97,30 +135,47 @@ async def get_resellers(
         status: Filter by status
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         List of resellers
     """
-    query = db.query(Reseller)
-    
+    # The count window function rides along on the same scan as the page
+    # itself, so the total costs no second query. load_only limits the
+    # row to the columns ResellerResponse actually serializes.
+    stmt = select(Reseller, func.count().over().label("total")).options(
+        load_only(
+            Reseller.id,
+            Reseller.name,
+            Reseller.email,
+            Reseller.phone,
+            Reseller.commission_rate,
+            Reseller.status,
+            Reseller.created_at,
+        )
+    )
+
     # Apply filters
     if name:
-        query = query.filter(Reseller.name.ilike(f"%{name}%"))
-    
+        stmt = stmt.where(Reseller.name.ilike(f"%{name}%"))
+
     if status:
-        query = query.filter(Reseller.status == status)
-    
+        stmt = stmt.where(Reseller.status == status)
+
     # Get resellers
-    resellers = query.offset(skip).limit(limit).all()
-    
-    return resellers
+    rows = db.execute(stmt.offset(skip).limit(limit)).all()
+
+    return _list_response(
+        _RESELLER_LIST,
+        [row.Reseller for row in rows],
+        rows[0].total if rows else 0
+    )
 
 
 @reseller_router.get("/{reseller_id}", response_model=ResellerDetailResponse)
 async def get_reseller(
     reseller_id: uuid.UUID,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Get a reseller by ID.
@@ -136,26 +191,33 @@ async def get_reseller(
     Raises:
         HTTPException: If the reseller is not found
     """
-    reseller = db.query(Reseller).filter(Reseller.id == reseller_id).first()
-    if not reseller:
+    # One round trip: the reseller row plus the three counts as correlated
+    # scalar subqueries, instead of a SELECT followed by three COUNT queries
+    row = db.execute(
+        select(
+            Reseller,
+            select(func.count())
+            .where(Tenant.reseller_id == Reseller.id)
+            .scalar_subquery()
+            .label("tenant_count"),
+            select(func.count())
+            .where(BrandingConfiguration.reseller_id == Reseller.id)
+            .scalar_subquery()
+            .label("branding_count"),
+            select(func.count())
+            .where(SubscriptionPlan.reseller_id == Reseller.id)
+            .scalar_subquery()
+            .label("plan_count")
+        ).where(Reseller.id == reseller_id)
+    ).first()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reseller not found"
         )
-    
-    # Count tenants
-    tenant_count = db.query(Tenant).filter(Tenant.reseller_id == reseller_id).count()
-    
-    # Count branding configurations
-    branding_count = db.query(BrandingConfiguration).filter(
-        BrandingConfiguration.reseller_id == reseller_id
-    ).count()
-    
-    # Count subscription plans
-    plan_count = db.query(SubscriptionPlan).filter(
-        SubscriptionPlan.reseller_id == reseller_id
-    ).count()
-    
+
+    reseller = row.Reseller
     return ResellerDetailResponse(
         id=reseller.id,
         name=reseller.name,
@@ -165,9 +227,9 @@ async def get_reseller(
         status=reseller.status,
         created_at=reseller.created_at,
         updated_at=reseller.updated_at,
-        tenant_count=tenant_count,
-        branding_configuration_count=branding_count,
-        subscription_plan_count=plan_count
+        tenant_count=row.tenant_count,
+        branding_configuration_count=row.branding_count,
+        subscription_plan_count=row.plan_count
     )
 
 
@@ -176,7 +238,7 @@ async def update_reseller(
     reseller_id: uuid.UUID,
     reseller_data: ResellerUpdate,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Update a reseller.
@@ -193,38 +255,47 @@ async def update_reseller(
     Raises:
         HTTPException: If the reseller is not found or the email is already registered
     """
-    reseller = db.query(Reseller).filter(Reseller.id == reseller_id).first()
-    if not reseller:
+    values = reseller_data.model_dump(exclude_unset=True)
+
+    if not values:
+        # Nothing to change; just load the row for the response
+        reseller = db.query(Reseller).filter(Reseller.id == reseller_id).first()
+        if not reseller:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Reseller not found"
+            )
+        return reseller
+
+    # One narrow UPDATE carrying only the changed columns; RETURNING
+    # doubles as the existence check and the response payload, so the row
+    # is never loaded into the identity map. Duplicate emails surface as
+    # an IntegrityError from the unique constraint.
+    try:
+        reseller = db.execute(
+            update(Reseller)
+            .where(Reseller.id == reseller_id)
+            .values(**values)
+            .returning(Reseller)
+        ).scalar_one_or_none()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+
+    if reseller is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reseller not found"
         )
-    
-    # Check if email is already registered
-    if reseller_data.email and reseller_data.email != reseller.email:
-        existing_reseller = db.query(Reseller).filter(Reseller.email == reseller_data.email).first()
-        if existing_reseller:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-    
-    # Update reseller
-    for key, value in reseller_data.dict(exclude_unset=True).items():
-        setattr(reseller, key, value)
-    
+
     db.commit()
-    db.refresh(reseller)
-    
-    return ResellerResponse(
-        id=reseller.id,
-        name=reseller.name,
-        email=reseller.email,
-        phone=reseller.phone,
-        commission_rate=reseller.commission_rate,
-        status=reseller.status,
-        created_at=reseller.created_at
-    )
+
+    # response_model serializes the ORM row via orm_mode
+    return reseller
 
 
 # Branding Configuration endpoints
@@ -234,7 +305,7 @@ async def create_branding_configuration(
     reseller_id: uuid.UUID,
     branding_data: BrandingConfigurationCreate,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Create a new branding configuration for a reseller.
@@ -251,88 +322,105 @@ async def create_branding_configuration(
     Raises:
         HTTPException: If the reseller is not found
     """
-    # Check if reseller exists
-    reseller = db.query(Reseller).filter(Reseller.id == reseller_id).first()
-    if not reseller:
+    # No existence pre-check: the reseller_id FK rejects an unknown
+    # reseller at commit, saving a round trip on every successful create
+
+    # If this is the default configuration, unset any existing default in
+    # one bulk UPDATE instead of loading the rows and flushing per-row
+    if branding_data.is_default:
+        db.query(BrandingConfiguration).filter(
+            BrandingConfiguration.reseller_id == reseller_id,
+            BrandingConfiguration.is_default == True
+        ).update({"is_default": False}, synchronize_session=False)
+
+    # Create branding configuration; RETURNING folds the refresh SELECT
+    # into the INSERT round trip
+    try:
+        branding_config = db.execute(
+            insert(BrandingConfiguration)
+            .values(
+                reseller_id=reseller_id,
+                name=branding_data.name,
+                is_default=branding_data.is_default,
+                theme=branding_data.theme,
+                assets=branding_data.assets,
+                texts=branding_data.texts
+            )
+            .returning(BrandingConfiguration)
+        ).scalar_one()
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        # Two constraints can fire here: the reseller_id FK (unknown
+        # reseller) and the one-default-per-reseller partial unique
+        # index (a concurrent default create won the demote-then-insert
+        # race). Tell them apart by the violated constraint's name.
+        if "branding_one_default_per_reseller_idx" in str(e.orig):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A default branding configuration was created concurrently"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reseller not found"
         )
-    
-    # If this is the default configuration, unset any existing default
+
     if branding_data.is_default:
-        existing_defaults = db.query(BrandingConfiguration).filter(
-            BrandingConfiguration.reseller_id == reseller_id,
-            BrandingConfiguration.is_default == True
-        ).all()
-        
-        for config in existing_defaults:
-            config.is_default = False
-    
-    # Create branding configuration
-    branding_config = BrandingConfiguration(
-        reseller_id=reseller_id,
-        name=branding_data.name,
-        is_default=branding_data.is_default,
-        theme=branding_data.theme,
-        assets=branding_data.assets,
-        texts=branding_data.texts
-    )
-    
-    db.add(branding_config)
-    db.commit()
-    db.refresh(branding_config)
-    
-    return BrandingConfigurationResponse(
-        id=branding_config.id,
-        reseller_id=branding_config.reseller_id,
-        name=branding_config.name,
-        is_default=branding_config.is_default,
-        theme=branding_config.theme,
-        assets=branding_config.assets,
-        texts=branding_config.texts,
-        created_at=branding_config.created_at
-    )
+        # The demotion bulk update bypasses ORM events, so drop any
+        # cached rows whose is_default it may have flipped
+        invalidate_branding_configurations()
+
+    # response_model serializes the ORM row via orm_mode
+    return branding_config
 
 
-@reseller_router.get("/{reseller_id}/branding", response_model=List[BrandingConfigurationResponse])
+@reseller_router.get("/{reseller_id}/branding")
 async def get_branding_configurations(
     reseller_id: uuid.UUID,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Get all branding configurations for a reseller.
-    
+
+    The total is returned in the X-Total-Count header so clients can
+    paginate without a second COUNT query.
+
     Args:
         reseller_id: Reseller ID
         skip: Number of configurations to skip
         limit: Maximum number of configurations to return
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         List of branding configurations
-        
+
     Raises:
         HTTPException: If the reseller is not found
     """
-    # Check if reseller exists
-    reseller = db.query(Reseller).filter(Reseller.id == reseller_id).first()
-    if not reseller:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Reseller not found"
-        )
-    
-    # Get branding configurations
-    branding_configs = db.query(BrandingConfiguration).filter(
-        BrandingConfiguration.reseller_id == reseller_id
-    ).offset(skip).limit(limit).all()
-    
-    return branding_configs
+    # Get branding configurations; the reseller is only validated when
+    # there is nothing to return, so the common case is a single query
+    rows = db.execute(
+        select(BrandingConfiguration, func.count().over().label("total"))
+        .where(BrandingConfiguration.reseller_id == reseller_id)
+        .offset(skip).limit(limit)
+    ).all()
+
+    if not rows:
+        if not db.query(exists().where(Reseller.id == reseller_id)).scalar():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Reseller not found"
+            )
+
+    return _list_response(
+        _BRANDING_LIST,
+        [row.BrandingConfiguration for row in rows],
+        rows[0].total if rows else 0
+    )
 
 
 # Subscription Plan endpoints
@@ -342,7 +430,7 @@ async def create_subscription_plan(
     reseller_id: uuid.UUID,
     plan_data: SubscriptionPlanCreate,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Create a new subscription plan for a reseller.
@@ -359,81 +447,132 @@ async def create_subscription_plan(
     Raises:
         HTTPException: If the reseller is not found
     """
-    # Check if reseller exists
-    reseller = db.query(Reseller).filter(Reseller.id == reseller_id).first()
-    if not reseller:
+    # No existence pre-check: the reseller_id FK rejects an unknown
+    # reseller at commit, saving a round trip on every successful create
+
+    # Create subscription plan; RETURNING folds the refresh SELECT into
+    # the INSERT round trip
+    try:
+        subscription_plan = db.execute(
+            insert(SubscriptionPlan)
+            .values(
+                reseller_id=reseller_id,
+                name=plan_data.name,
+                description=plan_data.description,
+                price_monthly=plan_data.price_monthly,
+                price_yearly=plan_data.price_yearly,
+                storage_quota_mb=plan_data.storage_quota_mb,
+                processing_quota_minutes=plan_data.processing_quota_minutes,
+                max_users=plan_data.max_users,
+                features=plan_data.features
+            )
+            .returning(SubscriptionPlan)
+        ).scalar_one()
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Reseller not found"
         )
-    
-    # Create subscription plan
-    subscription_plan = SubscriptionPlan(
-        reseller_id=reseller_id,
-        name=plan_data.name,
-        description=plan_data.description,
-        price_monthly=plan_data.price_monthly,
-        price_yearly=plan_data.price_yearly,
-        storage_quota_mb=plan_data.storage_quota_mb,
-        processing_quota_minutes=plan_data.processing_quota_minutes,
-        max_users=plan_data.max_users,
-        features=plan_data.features
-    )
-    
-    db.add(subscription_plan)
-    db.commit()
-    db.refresh(subscription_plan)
-    
-    return SubscriptionPlanResponse(
-        id=subscription_plan.id,
-        reseller_id=subscription_plan.reseller_id,
-        name=subscription_plan.name,
-        description=subscription_plan.description,
-        price_monthly=subscription_plan.price_monthly,
-        price_yearly=subscription_plan.price_yearly,
-        storage_quota_mb=subscription_plan.storage_quota_mb,
-        processing_quota_minutes=subscription_plan.processing_quota_minutes,
-        max_users=subscription_plan.max_users,
-        features=subscription_plan.features,
-        created_at=subscription_plan.created_at
-    )
+
+    # response_model serializes the ORM row via orm_mode
+    return subscription_plan
 
 
-@reseller_router.get("/{reseller_id}/plans", response_model=List[SubscriptionPlanResponse])
+@reseller_router.post("/{reseller_id}/plans:bulk", status_code=status.HTTP_201_CREATED)
+async def create_subscription_plans_bulk(
+    reseller_id: uuid.UUID,
+    plans: List[SubscriptionPlanCreate],
+    db: Session = Depends(get_db_session),
+    auth: dict = Depends(admin_required)
+):
+    """
+    Create multiple subscription plans for a reseller in one statement.
+
+    The per-plan create endpoint costs one INSERT round trip per row;
+    this variant executes a single multi-row INSERT, which is the fast
+    path for seeding a reseller's catalogue.
+
+    Args:
+        reseller_id: Reseller ID
+        plans: Subscription plan data
+        db: Database session
+        auth: Authentication data
+
+    Returns:
+        Count of created plans and their generated IDs
+
+    Raises:
+        HTTPException: If the reseller is not found
+    """
+    if not plans:
+        return {"created": 0, "ids": []}
+
+    try:
+        result = db.execute(
+            insert(SubscriptionPlan).returning(SubscriptionPlan.id),
+            [
+                plan.model_dump() | {"reseller_id": reseller_id}
+                for plan in plans
+            ]
+        )
+        ids = [row.id for row in result]
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Reseller not found"
+        )
+
+    return {"created": len(ids), "ids": ids}
+
+
+@reseller_router.get("/{reseller_id}/plans")
 async def get_subscription_plans(
     reseller_id: uuid.UUID,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db_session),
-    auth: dict = Depends(tenant_required(["admin"]))
+    auth: dict = Depends(admin_required)
 ):
     """
     Get all subscription plans for a reseller.
-    
+
+    The total is returned in the X-Total-Count header so clients can
+    paginate without a second COUNT query.
+
     Args:
         reseller_id: Reseller ID
         skip: Number of plans to skip
         limit: Maximum number of plans to return
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         List of subscription plans
-        
+
     Raises:
         HTTPException: If the reseller is not found
     """
-    # Check if reseller exists
-    reseller = db.query(Reseller).filter(Reseller.id == reseller_id).first()
-    if not reseller:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Reseller not found"
-        )
-    
-    # Get subscription plans
-    subscription_plans = db.query(SubscriptionPlan).filter(
-        SubscriptionPlan.reseller_id == reseller_id
-    ).offset(skip).limit(limit).all()
-    
-    return subscription_plans
+    # Get subscription plans; the reseller is only validated when there
+    # is nothing to return, so the common case is a single query
+    rows = db.execute(
+        select(SubscriptionPlan, func.count().over().label("total"))
+        .where(SubscriptionPlan.reseller_id == reseller_id)
+        .offset(skip).limit(limit)
+    ).all()
+
+    if not rows:
+        if not db.query(exists().where(Reseller.id == reseller_id)).scalar():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Reseller not found"
+            )
+
+    return _list_response(
+        _PLAN_LIST,
+        [row.SubscriptionPlan for row in rows],
+        rows[0].total if rows else 0
+    )
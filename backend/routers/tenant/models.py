@@ -3,8 +3,8 @@ Tenant models for multi-tenant support.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Literal, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
 import uuid
 
 
@@ -16,21 +16,13 @@ class TenantBase(BaseModel):
     domain: Optional[str] = None
     reseller_id: uuid.UUID
     subscription_plan_id: uuid.UUID
-    subscription_status: str = "trial"
+    # Literal: membership is checked by Pydantic's compiled core instead
+    # of a Python validator callback per request
+    subscription_status: Literal["trial", "active", "suspended", "expired"] = "trial"
     branding_configuration_id: Optional[uuid.UUID] = None
     storage_quota_mb: Optional[int] = None
     processing_quota_minutes: Optional[int] = None
 
-    @validator("subscription_status")
-    def validate_subscription_status(cls, v):
-        """
-        Validate subscription status.
-        """
-        allowed_statuses = ["trial", "active", "suspended", "expired"]
-        if v not in allowed_statuses:
-            raise ValueError(f"Subscription status must be one of {allowed_statuses}")
-        return v
-
 
 class TenantCreate(TenantBase):
     """
@@ -46,21 +38,17 @@ class TenantUpdate(BaseModel):
     name: Optional[str] = None
     domain: Optional[str] = None
     subscription_plan_id: Optional[uuid.UUID] = None
-    subscription_status: Optional[str] = None
+    subscription_status: Optional[Literal["trial", "active", "suspended", "expired"]] = None
     branding_configuration_id: Optional[uuid.UUID] = None
     storage_quota_mb: Optional[int] = None
     processing_quota_minutes: Optional[int] = None
 
-    @validator("subscription_status")
-    def validate_subscription_status(cls, v):
-        """
-        Validate subscription status.
-        """
-        if v is not None:
-            allowed_statuses = ["trial", "active", "suspended", "expired"]
-            if v not in allowed_statuses:
-                raise ValueError(f"Subscription status must be one of {allowed_statuses}")
-        return v
+
+class TenantBatchUpdate(TenantUpdate):
+    """
+    Tenant update model with the target ID, for batched updates.
+    """
+    id: uuid.UUID
 
 
 class TenantResponse(BaseModel):
@@ -78,8 +66,9 @@ class TenantResponse(BaseModel):
     processing_quota_minutes: int
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    # Frozen: response instances hold trusted DB data and are never
+    # mutated after construction, so skip the assignment machinery
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class SubscriptionPlanResponse(BaseModel):
@@ -96,8 +85,9 @@ class SubscriptionPlanResponse(BaseModel):
     max_users: int
     features: Dict[str, Any]
 
-    class Config:
-        orm_mode = True
+    # Frozen: response instances hold trusted DB data and are never
+    # mutated after construction, so skip the assignment machinery
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class BrandingConfigurationResponse(BaseModel):
@@ -111,8 +101,9 @@ class BrandingConfigurationResponse(BaseModel):
     assets: Dict[str, Any]
     texts: Dict[str, Any]
 
-    class Config:
-        orm_mode = True
+    # Frozen: response instances hold trusted DB data and are never
+    # mutated after construction, so skip the assignment machinery
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class TenantDetailResponse(TenantResponse):
@@ -152,3 +143,10 @@ class TenantQuotaResponse(BaseModel):
     tenant_id: uuid.UUID
     storage_quota: QuotaInfo
     processing_quota: ProcessingQuotaInfo
+
+
+# Force JSON-schema construction at import so the first OpenAPI or
+# documented-response request does not pay for it.
+TenantResponse.model_json_schema()
+TenantDetailResponse.model_json_schema()
+TenantQuotaResponse.model_json_schema()
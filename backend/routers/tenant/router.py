@@ -3,22 +3,28 @@ Tenant router for multi-tenant support.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from sqlalchemy import exists, func, select, tuple_, update
+from sqlalchemy.orm import Session, joinedload
 import uuid
 
 from backend.db.db_instance import get_db_session
-from backend.models.tenant import Tenant, BrandingConfiguration, SubscriptionPlan
+from backend.models.tenant import Tenant
 from backend.models.user import User
 from backend.middleware.tenant_context import tenant_required
+from backend.middleware.tenant_cache import invalidate_tenant
+from backend.utils.pagination import decode_cursor, encode_cursor
+from backend.utils.ref_cache import get_branding_configuration, get_subscription_plan
 from backend.utils.tenant_utils import (
     get_tenant_or_404,
+    tenant_exists,
     check_tenant_storage_quota,
     check_tenant_processing_quota
 )
 from .models import (
     TenantCreate,
     TenantUpdate,
+    TenantBatchUpdate,
     TenantResponse,
     TenantDetailResponse,
     TenantQuotaResponse
@@ -28,7 +34,7 @@ tenant_router = APIRouter()
 
 
 @tenant_router.post("/", response_model=TenantResponse, status_code=status.HTTP_201_CREATED)
-async def create_tenant(
+def create_tenant(
     tenant_data: TenantCreate,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required(["admin"]))
@@ -47,38 +53,32 @@ async def create_tenant(
     Raises:
         HTTPException: If the domain is already registered
     """
-    # Check if domain is already registered
+    # Check if domain is already registered; EXISTS returns a bare
+    # boolean instead of hydrating a Tenant row that is then discarded
     if tenant_data.domain:
-        existing_tenant = db.query(Tenant).filter(Tenant.domain == tenant_data.domain).first()
-        if existing_tenant:
+        if db.scalar(select(exists().where(Tenant.domain == tenant_data.domain))):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Domain already registered"
             )
-    
-    # Check if subscription plan exists
-    subscription_plan = db.query(SubscriptionPlan).filter(
-        SubscriptionPlan.id == tenant_data.subscription_plan_id
-    ).first()
-    
+
+    # Check if subscription plan exists (cached reference lookup)
+    subscription_plan = get_subscription_plan(tenant_data.subscription_plan_id)
+
     if not subscription_plan:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Subscription plan not found"
         )
-    
-    # Check if branding configuration exists
+
+    # Check if branding configuration exists (cached reference lookup)
     if tenant_data.branding_configuration_id:
-        branding_config = db.query(BrandingConfiguration).filter(
-            BrandingConfiguration.id == tenant_data.branding_configuration_id
-        ).first()
-        
-        if not branding_config:
+        if not get_branding_configuration(tenant_data.branding_configuration_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Branding configuration not found"
             )
-    
+
     # Create tenant
     tenant = Tenant(
         name=tenant_data.name,
@@ -94,90 +94,159 @@ async def create_tenant(
     db.add(tenant)
     db.commit()
     db.refresh(tenant)
-    
-    return TenantResponse(
-        id=tenant.id,
-        name=tenant.name,
-        domain=tenant.domain,
-        reseller_id=tenant.reseller_id,
-        subscription_plan_id=tenant.subscription_plan_id,
-        subscription_status=tenant.subscription_status,
-        branding_configuration_id=tenant.branding_configuration_id,
-        storage_quota_mb=tenant.storage_quota_mb,
-        processing_quota_minutes=tenant.processing_quota_minutes,
-        created_at=tenant.created_at
-    )
+
+    # response_model serializes the ORM object via from_attributes
+    return tenant
 
 
 @tenant_router.get("/", response_model=List[TenantResponse])
-async def get_tenants(
+def get_tenants(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, le=500),
     name: Optional[str] = None,
+    name_prefix: Optional[str] = None,
     reseller_id: Optional[uuid.UUID] = None,
     subscription_status: Optional[str] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required(["admin"]))
 ):
     """
     Get all tenants.
-    
+
+    Pass the X-Next-Cursor header value back as `cursor` to page without
+    the row-skip cost of deep offsets; `skip` is ignored when a cursor is
+    given.
+
     Args:
-        skip: Number of tenants to skip
+        response: Response object for the pagination header
+        skip: Number of tenants to skip (offset pagination)
         limit: Maximum number of tenants to return
-        name: Filter by name
+        name: Filter by name (substring match)
+        name_prefix: Filter by name prefix (cheaper anchored match)
         reseller_id: Filter by reseller ID
         subscription_status: Filter by subscription status
+        cursor: Keyset cursor from a previous page
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         List of tenants
     """
-    query = db.query(Tenant)
-    
-    # Apply filters
+    stmt = select(Tenant)
+
+    # Apply filters. A leading-wildcard ILIKE needs the trigram index;
+    # the anchored prefix form can use a plain btree, so callers that
+    # only need starts-with matching should prefer name_prefix.
     if name:
-        query = query.filter(Tenant.name.ilike(f"%{name}%"))
-    
+        stmt = stmt.where(Tenant.name.ilike(f"%{name}%"))
+
+    if name_prefix:
+        stmt = stmt.where(Tenant.name.ilike(f"{name_prefix}%"))
+
     if reseller_id:
-        query = query.filter(Tenant.reseller_id == reseller_id)
-    
+        stmt = stmt.where(Tenant.reseller_id == reseller_id)
+
     if subscription_status:
-        query = query.filter(Tenant.subscription_status == subscription_status)
-    
+        stmt = stmt.where(Tenant.subscription_status == subscription_status)
+
     # Get tenants
-    tenants = query.offset(skip).limit(limit).all()
-    
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Tenant.created_at, Tenant.id) < (cursor_ts, cursor_id)
+        )
+    else:
+        stmt = stmt.offset(skip)
+
+    tenants = db.scalars(
+        stmt.order_by(Tenant.created_at.desc(), Tenant.id.desc()).limit(limit)
+    ).all()
+
+    if len(tenants) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            tenants[-1].created_at, tenants[-1].id
+        )
+
     return tenants
 
 
 @tenant_router.get("/{tenant_id}", response_model=TenantDetailResponse)
-async def get_tenant(
+def get_tenant(
     tenant_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required(["admin"]))
 ):
     """
     Get a tenant by ID.
-    
+
+    Supports conditional requests: pass the previously returned ETag in
+    If-None-Match and an unchanged tenant answers 304 after a narrow
+    PK-index probe, skipping the joined load and serialization.
+
     Args:
         tenant_id: Tenant ID
+        response: Response object for the ETag header
+        if_none_match: Client's cached ETag, if any
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         Tenant
-        
+
     Raises:
         HTTPException: If the tenant is not found
     """
-    tenant = get_tenant_or_404(db, tenant_id)
-    
-    # Count users
-    user_count = db.query(User).filter(User.tenant_id == tenant_id).count()
+    # Cheap freshness probe before the full joined load
+    updated_at = db.scalar(
+        select(Tenant.updated_at).where(Tenant.id == tenant_id)
+    )
+
+    if updated_at is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tenant not found"
+        )
+
+    etag = f'W/"{int(updated_at.timestamp() * 1000):x}"'
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # One round trip serves the whole detail response: joinedload pulls
+    # the embedded to-one relations and the correlated subquery rides
+    # along for the user count
+    user_count_sq = (
+        select(func.count(User.id))
+        .where(User.tenant_id == Tenant.id)
+        .scalar_subquery()
+        .label("user_count")
+    )
+
+    row = db.execute(
+        select(Tenant, user_count_sq)
+        .options(
+            joinedload(Tenant.subscription_plan),
+            joinedload(Tenant.branding_configuration)
+        )
+        .where(Tenant.id == tenant_id)
+    ).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tenant not found"
+        )
+
+    tenant = row.Tenant
+    user_count = row.user_count
     
-    return TenantDetailResponse(
+    # model_construct skips re-validating values that came straight from
+    # the database; the declared response_model still shapes the output
+    return TenantDetailResponse.model_construct(
         id=tenant.id,
         name=tenant.name,
         domain=tenant.domain,
@@ -195,8 +264,64 @@ async def get_tenant(
     )
 
 
+@tenant_router.put("/batch")
+def update_tenants_batch(
+    updates: List[TenantBatchUpdate],
+    db: Session = Depends(get_db_session),
+    auth: dict = Depends(tenant_required(["admin"]))
+):
+    """
+    Apply a batch of tenant patches in one transaction.
+
+    Admin bulk-edit flows paid one commit (and one fsync) per tenant
+    through the single-update endpoint; here all patches are applied and
+    committed once. Declared before the /{tenant_id} route so "batch" is
+    not parsed as a tenant ID.
+
+    Args:
+        updates: Tenant patches, each carrying its target ID
+        db: Database session
+        auth: Authentication data
+
+    Returns:
+        Count of updated tenants
+
+    Raises:
+        HTTPException: If a referenced plan or branding config is missing
+    """
+    updated = 0
+    for item in updates:
+        values = item.model_dump(exclude_unset=True, exclude={"id"})
+        if not values:
+            continue
+
+        # Reference validation via the cached lookups is effectively free
+        if item.subscription_plan_id and not get_subscription_plan(item.subscription_plan_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Subscription plan not found"
+            )
+        if item.branding_configuration_id and not get_branding_configuration(item.branding_configuration_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Branding configuration not found"
+            )
+
+        result = db.execute(
+            update(Tenant).where(Tenant.id == item.id).values(**values)
+        )
+        updated += result.rowcount
+
+    db.commit()
+
+    for item in updates:
+        invalidate_tenant(item.id)
+
+    return {"updated": updated}
+
+
 @tenant_router.put("/{tenant_id}", response_model=TenantResponse)
-async def update_tenant(
+def update_tenant(
     tenant_id: uuid.UUID,
     tenant_data: TenantUpdate,
     db: Session = Depends(get_db_session),
@@ -221,8 +346,7 @@ async def update_tenant(
     
     # Check if domain is already registered
     if tenant_data.domain and tenant_data.domain != tenant.domain:
-        existing_tenant = db.query(Tenant).filter(Tenant.domain == tenant_data.domain).first()
-        if existing_tenant:
+        if db.scalar(select(exists().where(Tenant.domain == tenant_data.domain))):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Domain already registered"
@@ -230,83 +354,100 @@ async def update_tenant(
     
     # Check if subscription plan exists
     if tenant_data.subscription_plan_id:
-        subscription_plan = db.query(SubscriptionPlan).filter(
-            SubscriptionPlan.id == tenant_data.subscription_plan_id
-        ).first()
-        
-        if not subscription_plan:
+        if not get_subscription_plan(tenant_data.subscription_plan_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Subscription plan not found"
             )
-    
-    # Check if branding configuration exists
+
+    # Check if branding configuration exists (cached reference lookup)
     if tenant_data.branding_configuration_id:
-        branding_config = db.query(BrandingConfiguration).filter(
-            BrandingConfiguration.id == tenant_data.branding_configuration_id
-        ).first()
-        
-        if not branding_config:
+        if not get_branding_configuration(tenant_data.branding_configuration_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Branding configuration not found"
             )
     
-    # Update tenant
-    for key, value in tenant_data.dict(exclude_unset=True).items():
-        setattr(tenant, key, value)
-    
-    db.commit()
-    db.refresh(tenant)
-    
-    return TenantResponse(
-        id=tenant.id,
-        name=tenant.name,
-        domain=tenant.domain,
-        reseller_id=tenant.reseller_id,
-        subscription_plan_id=tenant.subscription_plan_id,
-        subscription_status=tenant.subscription_status,
-        branding_configuration_id=tenant.branding_configuration_id,
-        storage_quota_mb=tenant.storage_quota_mb,
-        processing_quota_minutes=tenant.processing_quota_minutes,
-        created_at=tenant.created_at
-    )
+    # Update tenant: UPDATE ... RETURNING folds the write and the
+    # re-read into one roundtrip instead of commit-then-refresh
+    values = tenant_data.model_dump(exclude_unset=True)
+    if values:
+        tenant = db.execute(
+            update(Tenant)
+            .where(Tenant.id == tenant_id)
+            .values(**values)
+            .returning(Tenant)
+        ).scalar_one()
+        db.commit()
+
+    # Drop any cached copy so the next request sees the update
+    invalidate_tenant(tenant_id)
+
+    # response_model serializes the ORM object via from_attributes
+    return tenant
 
 
 @tenant_router.get("/{tenant_id}/quota", response_model=TenantQuotaResponse)
-async def get_tenant_quota(
+def get_tenant_quota(
     tenant_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
 ):
     """
     Get tenant quota information.
-    
+
+    Supports conditional requests: dashboards polling this endpoint can
+    send the previous ETag in If-None-Match and get a bodiless 304 while
+    the usage numbers are unchanged.
+
     Args:
         tenant_id: Tenant ID
+        response: Response object for the ETag header
+        if_none_match: Client's cached ETag, if any
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         Tenant quota information
-        
+
     Raises:
         HTTPException: If the tenant is not found
     """
     # Check if user has access to this tenant
-    if str(tenant_id) != str(auth["tenant_id"]) and auth["role"] != "admin":
+    # UUIDs compare by value; no need to stringify both sides
+    if tenant_id != auth["tenant_id"] and auth["role"] != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to access this tenant"
         )
     
-    tenant = get_tenant_or_404(db, tenant_id)
-    
-    # Get quota information
+    # tenant_required already resolved the caller's own tenant, so only
+    # an admin reading another tenant pays the extra lookup - and that
+    # is an existence probe, not a full row load
+    if tenant_id != auth["tenant_id"] and not tenant_exists(db, tenant_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tenant not found"
+        )
+
+    # Get quota information (served from the usage caches when fresh)
     storage_quota = check_tenant_storage_quota(db, tenant_id)
     processing_quota = check_tenant_processing_quota(db, tenant_id)
-    
-    return TenantQuotaResponse(
+
+    # The quota and used figures fully determine the payload, so they
+    # make a sufficient weak ETag
+    etag = (
+        f'W/"{storage_quota["quota_mb"]}-{storage_quota["used_mb"]}'
+        f'-{processing_quota["quota_minutes"]}-{processing_quota["used_minutes"]}"'
+    )
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    # model_construct: the quota helpers return already-shaped values
+    return TenantQuotaResponse.model_construct(
         tenant_id=tenant_id,
         storage_quota=storage_quota,
         processing_quota=processing_quota
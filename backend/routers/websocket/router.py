@@ -2,12 +2,14 @@
 WebSocket router for real-time job updates.
 """
 
-import json
+import asyncio
 import logging
 import uuid
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from backend.db.db_instance import get_db_session
@@ -22,6 +24,73 @@ logger = logging.getLogger(__name__)
 websocket_router = APIRouter()
 
 
+async def _send_json(websocket: WebSocket, payload: Dict[str, Any]):
+    """
+    Send a JSON frame encoded with orjson instead of the stdlib encoder
+    starlette's send_json uses; orjson also serializes UUIDs natively.
+    """
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+# Completed jobs never change state again, so their subscribe snapshots
+# can be served from memory instead of a query. Failed and canceled
+# jobs are deliberately NOT cached: the retry endpoint transitions
+# exactly those statuses back to "queued", and a cached snapshot would
+# keep answering with the stale terminal state. The cache is cleared
+# wholesale when full, same as the other bounded in-process caches.
+_TERMINAL_STATUSES = frozenset(("completed",))
+_TERMINAL_CACHE_MAX = 10_000
+_terminal_jobs: Dict[uuid.UUID, Tuple[uuid.UUID, uuid.UUID, str, Optional[str]]] = {}
+
+
+def _job_snapshot(
+    job_id: uuid.UUID,
+    tenant_id: uuid.UUID
+) -> Tuple[uuid.UUID, uuid.UUID, str, Optional[str]]:
+    """
+    Get (tenant_id, user_id, status, result_path) for a job.
+
+    Terminal jobs are served from the in-process cache; everything else
+    is one tenant-scoped query, run via asyncio.to_thread so it does not
+    stall the event loop the websocket handlers share.
+
+    Raises:
+        HTTPException: If the job is not found in the tenant
+    """
+    cached = _terminal_jobs.get(job_id)
+    if cached is not None and cached[0] == tenant_id:
+        return cached
+
+    with get_db_session() as db:
+        job = get_tenant_record_or_404(
+            db=db,
+            model=Job,
+            record_id=job_id,
+            tenant_id=tenant_id
+        )
+        snapshot = (job.tenant_id, job.user_id, job.status, job.result_path)
+
+    if snapshot[2] in _TERMINAL_STATUSES:
+        if len(_terminal_jobs) >= _TERMINAL_CACHE_MAX:
+            _terminal_jobs.clear()
+        _terminal_jobs[job_id] = snapshot
+
+    return snapshot
+
+
+def _fetch_job_rows(job_ids: list, tenant_id: uuid.UUID):
+    """
+    Batch status lookup for a reconnecting client: one WHERE id IN (...)
+    query instead of a roundtrip per subscribed job. Run via
+    asyncio.to_thread.
+    """
+    with get_db_session() as db:
+        return db.execute(
+            select(Job.id, Job.user_id, Job.status, Job.result_path)
+            .where(Job.tenant_id == tenant_id, Job.id.in_(job_ids))
+        ).all()
+
+
 @websocket_router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """
@@ -46,19 +115,19 @@ async def websocket_endpoint(websocket: WebSocket):
                 
                 try:
                     # Parse message
-                    data = json.loads(message)
-                    
+                    data = orjson.loads(message)
+
                     # Process message
                     await process_message(data, websocket, tenant_id, user_id)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error(f"Invalid JSON message: {message}")
-                    await websocket.send_json({
+                    await _send_json(websocket, {
                         "type": "error",
                         "message": "Invalid JSON message"
                     })
                 except Exception as e:
                     logger.error(f"Error processing message: {str(e)}")
-                    await websocket.send_json({
+                    await _send_json(websocket, {
                         "type": "error",
                         "message": str(e)
                     })
@@ -76,10 +145,130 @@ async def websocket_endpoint(websocket: WebSocket):
             pass
 
 
+async def _handle_subscribe(data: Dict[str, Any], websocket: WebSocket, tenant_id: uuid.UUID, user_id: uuid.UUID):
+    """
+    Subscribe to updates for a single job.
+    """
+    job_id = uuid.UUID(data.get("job_id"))
+
+    # One snapshot serves both the access check and the status
+    # payload; terminal jobs come straight from the in-process cache
+    _, owner_id, job_status, result_path = await asyncio.to_thread(
+        _job_snapshot, job_id, tenant_id
+    )
+
+    # Check if user has access to the job
+    if owner_id != user_id and data.get("role") != "admin":
+        await _send_json(websocket, {
+            "type": "error",
+            "message": "Not authorized to access this job"
+        })
+        return
+
+    # Subscribe to job updates
+    await connection_manager.subscribe_to_job(websocket, job_id)
+
+    result = None
+    if job_status == "completed" and result_path:
+        result = {
+            "path": result_path
+        }
+
+    # Acknowledgement and current status ride in one frame, halving the
+    # per-subscribe framing and send overhead
+    await _send_json(websocket, {
+        "type": "subscribed",
+        "job_id": str(job_id),
+        "status": job_status,
+        "result": result
+    })
+
+
+async def _handle_subscribe_many(data: Dict[str, Any], websocket: WebSocket, tenant_id: uuid.UUID, user_id: uuid.UUID):
+    """
+    Batch resubscribe after a reconnect: one query for all jobs.
+    """
+    job_ids = [uuid.UUID(job_id) for job_id in data.get("job_ids", [])]
+
+    if not job_ids:
+        await _send_json(websocket, {
+            "type": "error",
+            "message": "job_ids must not be empty"
+        })
+        return
+
+    rows = await asyncio.to_thread(_fetch_job_rows, job_ids, tenant_id)
+    is_admin = data.get("role") == "admin"
+
+    jobs = []
+    for row in rows:
+        # Authorization filtered in-Python so one query covers the
+        # whole batch
+        if not is_admin and row.user_id != user_id:
+            continue
+
+        await connection_manager.subscribe_to_job(websocket, row.id)
+
+        result = None
+        if row.status == "completed" and row.result_path:
+            result = {
+                "path": row.result_path
+            }
+
+        jobs.append({
+            "job_id": str(row.id),
+            "status": row.status,
+            "result": result
+        })
+
+    # One frame carries the acknowledgement and every snapshot, instead
+    # of a frame per job plus a trailing ack
+    await _send_json(websocket, {
+        "type": "subscribed",
+        "job_ids": [job["job_id"] for job in jobs],
+        "jobs": jobs
+    })
+
+
+async def _handle_unsubscribe(data: Dict[str, Any], websocket: WebSocket, tenant_id: uuid.UUID, user_id: uuid.UUID):
+    """
+    Unsubscribe from job updates.
+    """
+    job_id = uuid.UUID(data.get("job_id"))
+
+    await connection_manager.unsubscribe_from_job(websocket, job_id)
+
+    # Send acknowledgement
+    await _send_json(websocket, {
+        "type": "unsubscribed",
+        "job_id": str(job_id)
+    })
+
+
+async def _handle_unknown(data: Dict[str, Any], websocket: WebSocket, tenant_id: uuid.UUID, user_id: uuid.UUID):
+    """
+    Reject an unknown message type.
+    """
+    await _send_json(websocket, {
+        "type": "error",
+        "message": f"Unknown message type: {data.get('type')}"
+    })
+
+
+# Built at import: one dict lookup dispatches a message instead of a
+# string-comparison chain, which matters on keep-alive streams
+_PONG = {"type": "pong"}
+_HANDLERS = {
+    "subscribe": _handle_subscribe,
+    "subscribe_many": _handle_subscribe_many,
+    "unsubscribe": _handle_unsubscribe,
+}
+
+
 async def process_message(data: Dict[str, Any], websocket: WebSocket, tenant_id: uuid.UUID, user_id: uuid.UUID):
     """
     Process WebSocket message.
-    
+
     Args:
         data: Message data
         websocket: WebSocket connection
@@ -87,74 +276,12 @@ async def process_message(data: Dict[str, Any], websocket: WebSocket, tenant_id:
         user_id: User ID
     """
     message_type = data.get("type")
-    
-    if message_type == "subscribe":
-        # Subscribe to job updates
-        job_id = uuid.UUID(data.get("job_id"))
-        
-        # Verify job exists and user has access
-        with get_db_session() as db:
-            job = get_tenant_record_or_404(
-                db=db,
-                model=Job,
-                record_id=job_id,
-                tenant_id=tenant_id
-            )
-            
-            # Check if user has access to the job
-            if str(job.user_id) != str(user_id) and data.get("role") != "admin":
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Not authorized to access this job"
-                })
-                return
-                
-        # Subscribe to job updates
-        await connection_manager.subscribe_to_job(websocket, job_id)
-        
-        # Send acknowledgement
-        await websocket.send_json({
-            "type": "subscribed",
-            "job_id": str(job_id)
-        })
-        
-        # Send current job status
-        with get_db_session() as db:
-            job = db.query(Job).filter(Job.id == job_id).first()
-            
-            if job:
-                result = None
-                if job.status == "completed" and job.result_path:
-                    result = {
-                        "path": job.result_path
-                    }
-                    
-                await websocket.send_json({
-                    "type": "job_update",
-                    "job_id": str(job_id),
-                    "status": job.status,
-                    "result": result
-                })
-    elif message_type == "unsubscribe":
-        # Unsubscribe from job updates
-        job_id = uuid.UUID(data.get("job_id"))
-        
-        # Unsubscribe from job updates
-        await connection_manager.unsubscribe_from_job(websocket, job_id)
-        
-        # Send acknowledgement
-        await websocket.send_json({
-            "type": "unsubscribed",
-            "job_id": str(job_id)
-        })
-    elif message_type == "ping":
-        # Ping-pong for connection keep-alive
-        await websocket.send_json({
-            "type": "pong"
-        })
-    else:
-        # Unknown message type
-        await websocket.send_json({
-            "type": "error",
-            "message": f"Unknown message type: {message_type}"
-        })
+
+    # Keep-alive pings are by far the most frequent frame; answer them
+    # before any other work
+    if message_type == "ping":
+        await _send_json(websocket, _PONG)
+        return
+
+    handler = _HANDLERS.get(message_type, _handle_unknown)
+    await handler(data, websocket, tenant_id, user_id)
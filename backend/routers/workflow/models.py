@@ -114,3 +114,10 @@ class JobDetailResponse(JobResponse):
     updated_at: datetime
     completed_at: Optional[datetime] = None
     workflow: Optional[WorkflowResponse] = None
+
+
+# Force schema construction at import so the first request does not pay
+# for it; the derived schemas are cached on the classes afterwards.
+WorkflowResponse.schema()
+JobResponse.schema()
+JobDetailResponse.schema()
@@ -3,13 +3,16 @@ Workflow router for multi-tenant support.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.orm import Session, joinedload
 import uuid
 
 from backend.db.db_instance import get_db_session
+from backend.job_queue.queue_manager import parse_workflow_config
 from backend.models.workflow import Workflow, Job
 from backend.middleware.tenant_context import tenant_required, get_tenant_id
+from backend.utils.pagination import decode_cursor, encode_cursor
 from backend.utils.tenant_utils import (
     get_tenant_record_or_404,
     get_tenant_records,
@@ -30,7 +33,7 @@ workflow_router = APIRouter()
 
 
 @workflow_router.post("/", response_model=WorkflowResponse, status_code=status.HTTP_201_CREATED)
-async def create_workflow(
+def create_workflow(
     workflow_data: WorkflowCreate,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
@@ -61,103 +64,155 @@ async def create_workflow(
         tenant_id=auth["tenant_id"]
     )
     
-    return WorkflowResponse(
-        id=workflow.id,
-        tenant_id=workflow.tenant_id,
-        user_id=workflow.user_id,
-        name=workflow.name,
-        description=workflow.description,
-        config=workflow.config,
-        is_template=workflow.is_template,
-        is_public=workflow.is_public,
-        created_at=workflow.created_at
-    )
+    # response_model serializes the ORM object via orm_mode
+    return workflow
 
 
 @workflow_router.get("/", response_model=List[WorkflowResponse])
-async def get_workflows(
+def get_workflows(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, le=500),
     name: Optional[str] = None,
+    name_prefix: Optional[str] = None,
     is_template: Optional[bool] = None,
     is_public: Optional[bool] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
 ):
     """
     Get all workflows for the current tenant.
-    
+
+    Pass the X-Next-Cursor header value back as `cursor` to page without
+    the row-skip cost of deep offsets; `skip` is ignored when a cursor is
+    given.
+
     Args:
-        skip: Number of workflows to skip
+        response: Response object for the pagination header
+        skip: Number of workflows to skip (offset pagination)
         limit: Maximum number of workflows to return
-        name: Filter by name
+        name: Filter by name (substring match)
+        name_prefix: Filter by name prefix (cheaper anchored match)
         is_template: Filter by template status
         is_public: Filter by public status
+        cursor: Keyset cursor from a previous page
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         List of workflows
     """
     # Build query
-    query = db.query(Workflow).filter(Workflow.tenant_id == auth["tenant_id"])
-    
-    # Apply filters
+    stmt = select(Workflow).where(Workflow.tenant_id == auth["tenant_id"])
+
+    # Apply filters. A leading-wildcard ILIKE needs the trigram index;
+    # the anchored prefix form can use a plain btree, so callers that
+    # only need starts-with matching should prefer name_prefix.
     if name:
-        query = query.filter(Workflow.name.ilike(f"%{name}%"))
-    
+        stmt = stmt.where(Workflow.name.ilike(f"%{name}%"))
+
+    if name_prefix:
+        stmt = stmt.where(Workflow.name.ilike(f"{name_prefix}%"))
+
     if is_template is not None:
-        query = query.filter(Workflow.is_template == is_template)
-    
+        stmt = stmt.where(Workflow.is_template == is_template)
+
     if is_public is not None:
-        query = query.filter(Workflow.is_public == is_public)
-    
+        stmt = stmt.where(Workflow.is_public == is_public)
+
     # Get workflows
-    workflows = query.offset(skip).limit(limit).all()
-    
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Workflow.created_at, Workflow.id) < (cursor_ts, cursor_id)
+        )
+    else:
+        stmt = stmt.offset(skip)
+
+    workflows = db.scalars(
+        stmt.order_by(Workflow.created_at.desc(), Workflow.id.desc()).limit(limit)
+    ).all()
+
+    if len(workflows) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            workflows[-1].created_at, workflows[-1].id
+        )
+
     return workflows
 
 
 @workflow_router.get("/{workflow_id}", response_model=WorkflowResponse)
-async def get_workflow(
+def get_workflow(
     workflow_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
 ):
     """
     Get a workflow by ID.
-    
+
+    Supports conditional requests: pass the previously returned ETag in
+    If-None-Match and an unchanged workflow answers 304 after a narrow
+    PK-index probe, skipping hydration and serialization.
+
     Args:
         workflow_id: Workflow ID
+        response: Response object for the ETag header
+        if_none_match: Client's cached ETag, if any
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         Workflow
-        
+
     Raises:
         HTTPException: If the workflow is not found
     """
-    # Get workflow with tenant isolation
-    workflow = get_tenant_record_or_404(
-        db=db,
-        model=Workflow,
-        record_id=workflow_id,
-        tenant_id=auth["tenant_id"]
-    )
-    
-    # Check if user has access to the workflow
-    if not workflow.is_public and str(workflow.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
+    # Authorization folded into the WHERE clause: rows the caller cannot
+    # see are never fetched or hydrated, and unauthorized access reads as
+    # 404 rather than 403 (which also avoids confirming the ID exists)
+    where = [
+        Workflow.id == workflow_id,
+        Workflow.tenant_id == auth["tenant_id"]
+    ]
+
+    if auth["role"] != "admin":
+        where.append(
+            or_(Workflow.is_public, Workflow.user_id == auth["user_id"])
+        )
+
+    # Cheap freshness probe under the same predicates before full load
+    probe = db.execute(select(Workflow.updated_at).where(*where)).first()
+
+    if probe is None:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this workflow"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Workflow not found"
         )
-    
+
+    if probe.updated_at is not None:
+        etag = f'W/"{int(probe.updated_at.timestamp() * 1000):x}"'
+        if if_none_match == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
+
+    workflow = db.scalars(select(Workflow).where(*where)).first()
+
+    if not workflow:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Workflow not found"
+        )
+
     return workflow
 
 
 @workflow_router.put("/{workflow_id}", response_model=WorkflowResponse)
-async def update_workflow(
+def update_workflow(
     workflow_id: uuid.UUID,
     workflow_data: WorkflowUpdate,
     db: Session = Depends(get_db_session),
@@ -187,7 +242,7 @@ async def update_workflow(
     )
     
     # Check if user has permission to update the workflow
-    if str(workflow.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
+    if workflow.user_id != auth["user_id"] and auth["role"] != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update this workflow"
@@ -207,12 +262,15 @@ async def update_workflow(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Workflow not found"
         )
-    
+
+    # Drop cached parses of the old configuration
+    parse_workflow_config.cache_clear()
+
     return updated_workflow
 
 
 @workflow_router.delete("/{workflow_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_workflow(
+def delete_workflow(
     workflow_id: uuid.UUID,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
@@ -237,7 +295,7 @@ async def delete_workflow(
     )
     
     # Check if user has permission to delete the workflow
-    if str(workflow.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
+    if workflow.user_id != auth["user_id"] and auth["role"] != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete this workflow"
@@ -263,7 +321,7 @@ async def delete_workflow(
 # Job endpoints
 
 @workflow_router.post("/jobs", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
-async def create_job(
+def create_job(
     job_data: JobCreate,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
@@ -292,7 +350,7 @@ async def create_job(
         )
         
         # Check if user has access to the workflow
-        if not workflow.is_public and str(workflow.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
+        if not workflow.is_public and workflow.user_id != auth["user_id"] and auth["role"] != "admin":
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to use this workflow"
@@ -311,63 +369,78 @@ async def create_job(
         tenant_id=auth["tenant_id"]
     )
     
-    return JobResponse(
-        id=job.id,
-        tenant_id=job.tenant_id,
-        user_id=job.user_id,
-        workflow_id=job.workflow_id,
-        status=job.status,
-        file_path=job.file_path,
-        result_path=job.result_path,
-        created_at=job.created_at
-    )
+    # response_model serializes the ORM object via orm_mode
+    return job
 
 
 @workflow_router.get("/jobs", response_model=List[JobResponse])
-async def get_jobs(
+def get_jobs(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, le=500),
     status: Optional[str] = None,
     workflow_id: Optional[uuid.UUID] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
 ):
     """
     Get all jobs for the current tenant.
-    
+
+    Pass the X-Next-Cursor header value back as `cursor` to page without
+    the row-skip cost of deep offsets; `skip` is ignored when a cursor is
+    given.
+
     Args:
-        skip: Number of jobs to skip
+        response: Response object for the pagination header
+        skip: Number of jobs to skip (offset pagination)
         limit: Maximum number of jobs to return
         status: Filter by status
         workflow_id: Filter by workflow ID
+        cursor: Keyset cursor from a previous page
         db: Database session
         auth: Authentication data
-        
+
     Returns:
         List of jobs
     """
     # Build query
-    query = db.query(Job).filter(Job.tenant_id == auth["tenant_id"])
-    
+    stmt = select(Job).where(Job.tenant_id == auth["tenant_id"])
+
     # Apply filters
     if status:
-        query = query.filter(Job.status == status)
-    
+        stmt = stmt.where(Job.status == status)
+
     if workflow_id:
-        query = query.filter(Job.workflow_id == workflow_id)
-    
+        stmt = stmt.where(Job.workflow_id == workflow_id)
+
     # Filter by user if not admin
     if auth["role"] != "admin":
-        query = query.filter(Job.user_id == auth["user_id"])
-    
+        stmt = stmt.where(Job.user_id == auth["user_id"])
+
     # Get jobs
-    jobs = query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
-    
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Job.created_at, Job.id) < (cursor_ts, cursor_id)
+        )
+    else:
+        stmt = stmt.offset(skip)
+
+    jobs = db.scalars(
+        stmt.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)
+    ).all()
+
+    if len(jobs) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(
+            jobs[-1].created_at, jobs[-1].id
+        )
+
     return jobs
 
 
 @workflow_router.get("/jobs/{job_id}", response_model=JobDetailResponse)
-async def get_job(
+def get_job(
     job_id: uuid.UUID,
     db: Session = Depends(get_db_session),
     auth: dict = Depends(tenant_required())
@@ -386,33 +459,27 @@ async def get_job(
     Raises:
         HTTPException: If the job is not found or the user is not authorized
     """
-    # Get job with tenant isolation
-    job = get_tenant_record_or_404(
-        db=db,
-        model=Job,
-        record_id=job_id,
-        tenant_id=auth["tenant_id"]
+    # Get job with tenant isolation; joinedload pulls the workflow the
+    # detail response embeds in the same statement, and ownership sits in
+    # the WHERE clause so unauthorized access reads as 404 with no
+    # hydration
+    stmt = (
+        select(Job)
+        .options(joinedload(Job.workflow))
+        .where(Job.id == job_id, Job.tenant_id == auth["tenant_id"])
     )
-    
-    # Check if user has access to the job
-    if str(job.user_id) != str(auth["user_id"]) and auth["role"] != "admin":
+
+    if auth["role"] != "admin":
+        stmt = stmt.where(Job.user_id == auth["user_id"])
+
+    job = db.scalars(stmt).first()
+
+    if not job:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this job"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
         )
-    
-    return JobDetailResponse(
-        id=job.id,
-        tenant_id=job.tenant_id,
-        user_id=job.user_id,
-        workflow_id=job.workflow_id,
-        status=job.status,
-        file_path=job.file_path,
-        result_path=job.result_path,
-        error=job.error,
-        processing_time=job.processing_time,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
-        completed_at=job.completed_at,
-        workflow=job.workflow
-    )
+
+    # response_model serializes the ORM object via orm_mode; the
+    # embedded workflow is already eager-loaded above
+    return job
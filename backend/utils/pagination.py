@@ -0,0 +1,60 @@
+"""
+Cursor helpers for keyset pagination.
+
+Offset pagination scans and discards `skip` rows on every page, so deep
+pages get slower the further the client walks. A cursor pinning the last
+seen `(created_at, id)` pair lets the next page start from an index seek
+instead, keeping page cost constant at any depth.
+"""
+
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+import orjson
+from fastapi import HTTPException, status
+
+
+def encode_cursor(created_at: datetime, record_id: uuid.UUID) -> str:
+    """
+    Encode a keyset cursor for the last row of a page.
+
+    Args:
+        created_at: The row's creation timestamp
+        record_id: The row's ID (tiebreaker for equal timestamps)
+
+    Returns:
+        URL-safe opaque cursor string
+    """
+    payload = orjson.dumps({
+        "created_at": created_at.isoformat(),
+        "id": str(record_id)
+    })
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a keyset cursor.
+
+    Args:
+        cursor: Cursor string produced by encode_cursor
+
+    Returns:
+        The (created_at, id) pair the next page should start after
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return (
+            datetime.fromisoformat(payload["created_at"]),
+            uuid.UUID(payload["id"])
+        )
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
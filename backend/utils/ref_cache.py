@@ -0,0 +1,111 @@
+"""
+Read-through TTL cache for rarely-changing reference rows.
+
+Subscription plans and branding configurations are written a handful of
+times and read on every tenant create/update, where they were fetched
+with a fresh SELECT just to validate existence. Caching them by ID makes
+those validations free after the first hit.
+
+Staleness is bounded the same way as the tenant cache: a short TTL
+covers writes this process never observes (bulk/Core updates, other
+workers), and the reseller write endpoints invalidate explicitly for
+changes they make themselves. Misses are not cached, so a row created
+after a failed lookup is found on the next call.
+"""
+
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select
+
+from backend.db.db_instance import get_db_session
+from backend.models.tenant import BrandingConfiguration, SubscriptionPlan
+
+REF_CACHE_TTL = 30.0
+REF_CACHE_MAX = 1024
+
+_plan_cache: Dict[str, tuple] = {}
+_branding_cache: Dict[str, tuple] = {}
+
+
+def _cache_get(cache: Dict[str, tuple], key: str) -> Optional[Any]:
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    row, expires_at = cached
+    if time.monotonic() >= expires_at:
+        del cache[key]
+        return None
+    return row
+
+
+def _cache_put(cache: Dict[str, tuple], key: str, row: Any):
+    if len(cache) >= REF_CACHE_MAX:
+        cache.clear()
+    cache[key] = (row, time.monotonic() + REF_CACHE_TTL)
+
+
+def get_subscription_plan(plan_id: uuid.UUID) -> Optional[SubscriptionPlan]:
+    """
+    Get a subscription plan by ID, served from cache while fresh.
+
+    Args:
+        plan_id: Subscription plan ID
+
+    Returns:
+        The (detached) plan row, or None if it does not exist
+    """
+    plan = _cache_get(_plan_cache, str(plan_id))
+    if plan is not None:
+        return plan
+
+    with get_db_session() as db:
+        plan = db.scalars(
+            select(SubscriptionPlan).where(SubscriptionPlan.id == plan_id)
+        ).first()
+
+    if plan is not None:
+        _cache_put(_plan_cache, str(plan_id), plan)
+    return plan
+
+
+def get_branding_configuration(config_id: uuid.UUID) -> Optional[BrandingConfiguration]:
+    """
+    Get a branding configuration by ID, served from cache while fresh.
+
+    Args:
+        config_id: Branding configuration ID
+
+    Returns:
+        The (detached) configuration row, or None if it does not exist
+    """
+    config = _cache_get(_branding_cache, str(config_id))
+    if config is not None:
+        return config
+
+    with get_db_session() as db:
+        config = db.scalars(
+            select(BrandingConfiguration).where(
+                BrandingConfiguration.id == config_id
+            )
+        ).first()
+
+    if config is not None:
+        _cache_put(_branding_cache, str(config_id), config)
+    return config
+
+
+def invalidate_subscription_plans():
+    """
+    Drop all cached plans, e.g. after a reseller endpoint writes plans.
+    """
+    _plan_cache.clear()
+
+
+def invalidate_branding_configurations():
+    """
+    Drop all cached branding configurations, e.g. after the default
+    demotion bulk-updates rows this process may have cached.
+    """
+    _branding_cache.clear()
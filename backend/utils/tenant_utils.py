@@ -2,14 +2,27 @@
 Utility functions for tenant-aware database operations.
 """
 
+import datetime
+import functools
 import os
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Type, TypeVar, Union
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
 
+from backend.middleware.tenant_cache import (
+    cache_tenant,
+    cache_tenant_by_domain,
+    get_cached_tenant,
+    get_cached_tenant_by_domain,
+)
 from backend.models.tenant import Tenant
 from backend.models.user import User
+from backend.models.workflow import UsageRecord
 from backend.database import Base
 
 # Type variable for SQLAlchemy models
@@ -30,12 +43,42 @@ def get_tenant_or_404(db: Session, tenant_id: uuid.UUID) -> Tenant:
     Raises:
         HTTPException: If tenant not found
     """
+    # Same short-TTL cache the middleware uses: the quota helpers call
+    # this on every request, so the common case is a dict read. Update
+    # endpoints invalidate on commit.
+    tenant = get_cached_tenant(tenant_id)
+    if tenant is not None:
+        return tenant
+
     tenant = db.query(Tenant).filter(Tenant.id == tenant_id).first()
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
+    cache_tenant(tenant_id, tenant)
     return tenant
 
 
+def tenant_exists(db: Session, tenant_id: uuid.UUID) -> bool:
+    """
+    Check whether a tenant exists without hydrating the row.
+
+    Callers that only validate the id should use this instead of
+    get_tenant_or_404: an EXISTS probe is an index-only scan returning
+    one boolean, and a fresh cache entry answers without any query.
+
+    Args:
+        db: Database session
+        tenant_id: Tenant ID
+
+    Returns:
+        True if the tenant exists
+    """
+    if get_cached_tenant(tenant_id) is not None:
+        return True
+    return bool(
+        db.scalar(select(exists().where(Tenant.id == tenant_id)))
+    )
+
+
 def get_tenant_by_domain(db: Session, domain: str) -> Optional[Tenant]:
     """
     Get a tenant by domain.
@@ -47,7 +90,14 @@ def get_tenant_by_domain(db: Session, domain: str) -> Optional[Tenant]:
     Returns:
         Tenant object or None if not found
     """
-    return db.query(Tenant).filter(Tenant.domain == domain).first()
+    tenant = get_cached_tenant_by_domain(domain)
+    if tenant is not None:
+        return tenant
+
+    tenant = db.query(Tenant).filter(Tenant.domain == domain).first()
+    if tenant is not None:
+        cache_tenant_by_domain(domain, tenant)
+    return tenant
 
 
 def get_tenant_by_user(db: Session, user_id: uuid.UUID) -> Optional[Tenant]:
@@ -61,42 +111,116 @@ def get_tenant_by_user(db: Session, user_id: uuid.UUID) -> Optional[Tenant]:
     Returns:
         Tenant object or None if not found
     """
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        return None
-    return user.tenant
+    # Single JOINed query instead of fetching the User and lazy-loading
+    # user.tenant in a second round-trip; the User row itself is never
+    # needed by callers so it is not hydrated at all
+    return db.scalars(
+        select(Tenant)
+        .join(User, User.tenant_id == Tenant.id)
+        .where(User.id == user_id)
+    ).first()
+
+
+@functools.lru_cache(maxsize=256)
+def _tenant_col(model: Type[T]):
+    """
+    Resolve a model's tenant_id column attribute once per class.
+
+    The instrumented-attribute lookup walks the class manager on every
+    access; caching it means tenant_filter only pays for building the
+    comparison expression, which the compiled-statement cache then keys
+    on by shape.
+    """
+    return model.tenant_id
+
+
+def load_request_context(db: Session, user_id: uuid.UUID):
+    """
+    Load a user and their tenant in one JOINed query.
+
+    For flows that need both objects; the joinedload folds the tenant
+    into the user select so the pair costs one round-trip instead of a
+    user query followed by a tenant query.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        Tuple of (user, tenant), or (None, None) if the user is unknown
+    """
+    user = db.scalars(
+        select(User)
+        .options(joinedload(User.tenant))
+        .where(User.id == user_id)
+    ).first()
+    if user is None:
+        return None, None
+    return user, user.tenant
 
 
 def tenant_filter(model: Type[T], tenant_id: uuid.UUID):
     """
     Create a filter condition for tenant isolation.
-    
+
     Args:
         model: SQLAlchemy model class
         tenant_id: Tenant ID
-        
+
     Returns:
         SQLAlchemy filter condition
     """
-    return model.tenant_id == tenant_id
+    return _tenant_col(model) == tenant_id
 
 
 def get_tenant_record(db: Session, model: Type[T], record_id: uuid.UUID, tenant_id: uuid.UUID) -> Optional[T]:
     """
     Get a record with tenant isolation.
-    
+
+    Uses Session.get so a record already in the session's identity map
+    (e.g. re-read within the same request after a mutation) is returned
+    without a round-trip; the tenant check happens on the loaded object.
+    Use get_tenant_record_scoped when the tenant predicate must run in
+    the database instead.
+
     Args:
         db: Database session
         model: SQLAlchemy model class
         record_id: Record ID
         tenant_id: Tenant ID
-        
+
+    Returns:
+        Record object or None if not found
+    """
+    record = db.get(model, record_id)
+    if record is None or record.tenant_id != tenant_id:
+        return None
+    return record
+
+
+def get_tenant_record_scoped(db: Session, model: Type[T], record_id: uuid.UUID, tenant_id: uuid.UUID) -> Optional[T]:
+    """
+    Get a record with the tenant filter applied in the WHERE clause.
+
+    Unlike get_tenant_record this always round-trips, but the database
+    evaluates the tenant predicate itself (index-only, no cross-tenant
+    row ever leaves the server) and the select() shape hits the
+    compiled-statement cache.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model class
+        record_id: Record ID
+        tenant_id: Tenant ID
+
     Returns:
         Record object or None if not found
     """
-    return db.query(model).filter(
-        model.id == record_id,
-        tenant_filter(model, tenant_id)
+    return db.scalars(
+        select(model).where(
+            model.id == record_id,
+            tenant_filter(model, tenant_id)
+        )
     ).first()
 
 
@@ -122,23 +246,41 @@ def get_tenant_record_or_404(db: Session, model: Type[T], record_id: uuid.UUID,
     return record
 
 
-def get_tenant_records(db: Session, model: Type[T], tenant_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[T]:
+def get_tenant_records(
+    db: Session,
+    model: Type[T],
+    tenant_id: uuid.UUID,
+    skip: int = 0,
+    limit: int = 100,
+    after_id: Optional[uuid.UUID] = None
+) -> List[T]:
     """
     Get records with tenant isolation.
-    
+
+    Results are ordered by primary key so pages are stable across
+    requests. Pass the last id of the previous page as `after_id` to
+    page by keyset instead of paying OFFSET's row-skip cost; `skip` is
+    ignored when `after_id` is given.
+
     Args:
         db: Database session
         model: SQLAlchemy model class
         tenant_id: Tenant ID
-        skip: Number of records to skip
+        skip: Number of records to skip (offset pagination)
         limit: Maximum number of records to return
-        
+        after_id: Last id of the previous page (keyset pagination)
+
     Returns:
         List of record objects
     """
-    return db.query(model).filter(
-        tenant_filter(model, tenant_id)
-    ).offset(skip).limit(limit).all()
+    stmt = select(model).where(tenant_filter(model, tenant_id))
+
+    if after_id is not None:
+        stmt = stmt.where(model.id > after_id)
+    else:
+        stmt = stmt.offset(skip)
+
+    return list(db.scalars(stmt.order_by(model.id).limit(limit)).all())
 
 
 def create_tenant_record(db: Session, model: Type[T], data: Dict[str, Any], tenant_id: uuid.UUID) -> T:
@@ -154,15 +296,76 @@ def create_tenant_record(db: Session, model: Type[T], data: Dict[str, Any], tena
     Returns:
         Created record object
     """
-    # Add tenant_id to data
-    data["tenant_id"] = tenant_id
-    
-    # Create record
-    record = model(**data)
-    db.add(record)
+    # Single-row case of the bulk path: one INSERT .. RETURNING plus one
+    # commit instead of flush-commit-refresh round-trips
+    return create_tenant_records_bulk(db, model, [data], tenant_id)[0]
+
+
+def create_tenant_records_bulk(
+    db: Session,
+    model: Type[T],
+    datas: List[Dict[str, Any]],
+    tenant_id: uuid.UUID
+) -> List[T]:
+    """
+    Create several records with tenant isolation in one statement.
+
+    N inserts cost one executemany round-trip plus one commit instead of
+    a commit and refresh per record.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model class
+        datas: List of record data dicts
+        tenant_id: Tenant ID
+
+    Returns:
+        List of created record objects, in input order
+    """
+    if not datas:
+        return []
+
+    records = db.scalars(
+        insert(model).returning(model),
+        [{**data, "tenant_id": tenant_id} for data in datas]
+    ).all()
     db.commit()
-    db.refresh(record)
-    return record
+    return list(records)
+
+
+def update_tenant_records_bulk(
+    db: Session,
+    model: Type[T],
+    record_ids: List[uuid.UUID],
+    data: Dict[str, Any],
+    tenant_id: uuid.UUID
+) -> int:
+    """
+    Apply the same update to several records with tenant isolation.
+
+    One UPDATE .. WHERE id IN (...) statement and one commit, instead of
+    a select-mutate-commit cycle per record.
+
+    Args:
+        db: Database session
+        model: SQLAlchemy model class
+        record_ids: Record IDs to update
+        data: Column values to set
+        tenant_id: Tenant ID
+
+    Returns:
+        Number of rows updated
+    """
+    if not record_ids or not data:
+        return 0
+
+    result = db.execute(
+        update(model)
+        .where(model.id.in_(record_ids), tenant_filter(model, tenant_id))
+        .values(**data)
+    )
+    db.commit()
+    return result.rowcount
 
 
 def update_tenant_record(db: Session, model: Type[T], record_id: uuid.UUID, data: Dict[str, Any], tenant_id: uuid.UUID) -> Optional[T]:
@@ -179,17 +382,24 @@ def update_tenant_record(db: Session, model: Type[T], record_id: uuid.UUID, data
     Returns:
         Updated record object or None if not found
     """
-    # Get record with tenant isolation
-    record = get_tenant_record(db, model, record_id, tenant_id)
-    if not record:
+    if not data:
+        # Nothing to set; preserve the return-the-record contract
+        return get_tenant_record(db, model, record_id, tenant_id)
+
+    # One UPDATE .. RETURNING round-trip instead of select, mutate,
+    # commit, refresh
+    record = db.scalars(
+        update(model)
+        .where(model.id == record_id, tenant_filter(model, tenant_id))
+        .values(**data)
+        .returning(model)
+    ).one_or_none()
+
+    if record is None:
+        db.rollback()
         return None
-    
-    # Update record
-    for key, value in data.items():
-        setattr(record, key, value)
-    
+
     db.commit()
-    db.refresh(record)
     return record
 
 
@@ -206,59 +416,238 @@ def delete_tenant_record(db: Session, model: Type[T], record_id: uuid.UUID, tena
     Returns:
         True if record was deleted, False if not found
     """
-    # Get record with tenant isolation
-    record = get_tenant_record(db, model, record_id, tenant_id)
-    if not record:
-        return False
-    
-    # Delete record
-    db.delete(record)
+    # One DELETE .. WHERE round-trip; the row is never selected or
+    # hydrated just to be removed
+    result = db.execute(
+        delete(model).where(
+            model.id == record_id,
+            tenant_filter(model, tenant_id)
+        )
+    )
     db.commit()
-    return True
+    return result.rowcount > 0
+
+
+@functools.lru_cache(maxsize=4096)
+def _tenant_path(tenant_id_str: str) -> str:
+    """
+    Compute a tenant's storage path once per process; the join and env
+    lookup are memoized on the string form of the id.
+
+    Tenant directories are sharded on the first two hex-pairs of the id
+    (storage/ab/cd/{tenant_id}) so the base directory's entry count
+    stays flat as tenants grow, keeping scandir batches small enough to
+    sit in the dentry cache.
+    """
+    base_path = os.environ.get("STORAGE_PATH", "storage")
+    return os.path.join(
+        base_path, tenant_id_str[0:2], tenant_id_str[2:4], tenant_id_str
+    )
+
+
+# Directories already ensured this process; makedirs costs a stat/mkdir
+# syscall pair even with exist_ok, so it fires once per tenant
+_ensured_paths: set = set()
+_ensured_lock = threading.Lock()
 
 
 def get_tenant_storage_path(tenant_id: uuid.UUID) -> str:
     """
     Get the storage path for a tenant.
-    
+
     Args:
         tenant_id: Tenant ID
-        
+
     Returns:
         Storage path
     """
-    base_path = os.environ.get("STORAGE_PATH", "storage")
-    tenant_path = os.path.join(base_path, str(tenant_id))
-    
-    # Create directory if it doesn't exist
-    os.makedirs(tenant_path, exist_ok=True)
-    
+    tenant_id_str = str(tenant_id)
+    tenant_path = _tenant_path(tenant_id_str)
+
+    if tenant_path not in _ensured_paths:
+        with _ensured_lock:
+            if tenant_path not in _ensured_paths:
+                # One-shot migration of the pre-sharding flat layout:
+                # an existing storage/{tenant_id} directory is moved
+                # into its shard on first access
+                legacy_path = os.path.join(
+                    os.environ.get("STORAGE_PATH", "storage"), tenant_id_str
+                )
+                if os.path.isdir(legacy_path) and not os.path.isdir(tenant_path):
+                    os.makedirs(os.path.dirname(tenant_path), exist_ok=True)
+                    os.replace(legacy_path, tenant_path)
+                else:
+                    os.makedirs(tenant_path, exist_ok=True)
+                _ensured_paths.add(tenant_path)
+
     return tenant_path
 
 
+# Storage usage is a full directory walk, so its result is cached for a
+# short TTL: dashboards polling the quota endpoint pay for at most one
+# walk per tenant per TTL instead of one per request. Bounded and
+# cleared wholesale when full, same as the other in-process caches.
+_STORAGE_USAGE_TTL = 60.0
+_STORAGE_USAGE_MAX = 10_000
+_storage_usage_cache: Dict[str, tuple] = {}
+
+
+def _get_cached_storage_bytes(tenant_id: uuid.UUID) -> Optional[int]:
+    """
+    Get the cached byte total for a tenant, or None on miss/expiry.
+    """
+    cached = _storage_usage_cache.get(str(tenant_id))
+    if cached is None:
+        return None
+    used_bytes, expires_at = cached
+    if time.monotonic() >= expires_at:
+        del _storage_usage_cache[str(tenant_id)]
+        return None
+    return used_bytes
+
+
+def _cache_storage_bytes(tenant_id: uuid.UUID, used_bytes: int):
+    """
+    Store a tenant's byte total with the standard TTL.
+    """
+    if len(_storage_usage_cache) >= _STORAGE_USAGE_MAX:
+        _storage_usage_cache.clear()
+    _storage_usage_cache[str(tenant_id)] = (
+        used_bytes, time.monotonic() + _STORAGE_USAGE_TTL
+    )
+
+
+def invalidate_storage_usage(tenant_id: uuid.UUID):
+    """
+    Drop a tenant's cached storage total, e.g. after a job writes or
+    deletes result files, so the next quota check re-walks immediately
+    instead of serving a stale total for up to a TTL.
+    """
+    _storage_usage_cache.pop(str(tenant_id), None)
+
+
+# The monthly processing total is an aggregate scan over UsageRecord
+# rows, so it gets the same treatment as the storage walk: one scan per
+# tenant per TTL, invalidated when the job queue records new usage.
+_processing_usage_cache: Dict[str, tuple] = {}
+
+
+def _get_cached_processing_minutes(tenant_id: uuid.UUID) -> Optional[float]:
+    """
+    Get the cached monthly minute total for a tenant, or None on
+    miss/expiry.
+    """
+    cached = _processing_usage_cache.get(str(tenant_id))
+    if cached is None:
+        return None
+    used_minutes, expires_at = cached
+    if time.monotonic() >= expires_at:
+        del _processing_usage_cache[str(tenant_id)]
+        return None
+    return used_minutes
+
+
+def _cache_processing_minutes(tenant_id: uuid.UUID, used_minutes: float):
+    """
+    Store a tenant's monthly minute total with the standard TTL.
+    """
+    if len(_processing_usage_cache) >= _STORAGE_USAGE_MAX:
+        _processing_usage_cache.clear()
+    _processing_usage_cache[str(tenant_id)] = (
+        used_minutes, time.monotonic() + _STORAGE_USAGE_TTL
+    )
+
+
+def invalidate_processing_usage(tenant_id: uuid.UUID):
+    """
+    Drop a tenant's cached monthly processing total after new usage is
+    recorded.
+    """
+    _processing_usage_cache.pop(str(tenant_id), None)
+
+
+def _iter_sizes(path: str):
+    """
+    Yield file sizes under a directory tree.
+
+    scandir returns each entry's type and stat from the same syscall
+    batch, so this avoids the extra per-file stat that os.walk plus
+    os.path.getsize would issue (and the joined-path string each needs).
+    Symlinks are not followed, so a link into another tenant's tree
+    cannot inflate the total.
+
+    The traversal is an explicit stack rather than recursion, so deep
+    trees cost one list entry per pending directory instead of a Python
+    frame per nesting level (and no generator-in-generator delegation).
+    """
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _scan_tree_bytes(path: str) -> int:
+    """
+    Total file bytes under a directory tree.
+
+    Top-level subdirectories are walked concurrently in a thread pool so
+    stat latency overlaps - near-linear in subdirectory count on network
+    or high-latency storage, harmless on local disk. Falls back to a
+    serial walk when there are fewer than two subdirectories or the
+    TENANT_QUOTA_SCAN_WORKERS knob disables the pool.
+    """
+    root_bytes = 0
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                root_bytes += entry.stat(follow_symlinks=False).st_size
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+
+    workers = int(os.environ.get("TENANT_QUOTA_SCAN_WORKERS", "8"))
+    if len(subdirs) < 2 or workers < 2:
+        return root_bytes + sum(
+            size for subdir in subdirs for size in _iter_sizes(subdir)
+        )
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as pool:
+        return root_bytes + sum(
+            pool.map(lambda subdir: sum(_iter_sizes(subdir)), subdirs)
+        )
+
+
 def check_tenant_storage_quota(db: Session, tenant_id: uuid.UUID) -> Dict[str, Any]:
     """
     Check storage quota for a tenant.
-    
+
     Args:
         db: Database session
         tenant_id: Tenant ID
-        
+
     Returns:
         Dict with quota information
     """
     tenant = get_tenant_or_404(db, tenant_id)
-    
+
     # Get storage path
     storage_path = get_tenant_storage_path(tenant_id)
-    
-    # Calculate used storage
-    used_storage_mb = 0
-    for root, _, files in os.walk(storage_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            used_storage_mb += os.path.getsize(file_path) / (1024 * 1024)
-    
+
+    # Serve the byte total from the short-TTL cache when fresh; only a
+    # miss pays for the directory walk
+    used_bytes = _get_cached_storage_bytes(tenant_id)
+    if used_bytes is None:
+        used_bytes = _scan_tree_bytes(storage_path)
+        _cache_storage_bytes(tenant_id, used_bytes)
+
+    # Convert to MB once at the end, keeping the division out of the
+    # per-file loop
+    used_storage_mb = used_bytes / (1024 * 1024)
+
     return {
         "quota_mb": tenant.storage_quota_mb,
         "used_mb": round(used_storage_mb, 2),
@@ -267,6 +656,28 @@ def check_tenant_storage_quota(db: Session, tenant_id: uuid.UUID) -> Dict[str, A
     }
 
 
+# Month-start boundary, recomputed at most once per day. Besides
+# skipping the datetime.replace chain per call, a value that is stable
+# across requests keeps the aggregate's bound parameter constant so the
+# database can reuse its plan. The bucket is the local calendar date
+# from the same now() call that produces the value, so the cache rolls
+# over exactly when the month does regardless of timezone.
+_month_start_cache: tuple = (None, None)
+
+
+def _current_month_start() -> datetime.datetime:
+    """
+    Start of the current month, cached per day.
+    """
+    global _month_start_cache
+    now = datetime.datetime.now()
+    bucket = (now.year, now.month, now.day)
+    if _month_start_cache[0] != bucket:
+        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        _month_start_cache = (bucket, start)
+    return _month_start_cache[1]
+
+
 def check_tenant_processing_quota(db: Session, tenant_id: uuid.UUID) -> Dict[str, Any]:
     """
     Check processing quota for a tenant.
@@ -278,23 +689,32 @@ def check_tenant_processing_quota(db: Session, tenant_id: uuid.UUID) -> Dict[str
     Returns:
         Dict with quota information
     """
-    from backend.models.workflow import UsageRecord
-    
     tenant = get_tenant_or_404(db, tenant_id)
-    
-    # Calculate used processing time
-    current_month_start = datetime.datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    
-    used_minutes = db.query(func.sum(UsageRecord.amount)).filter(
-        UsageRecord.tenant_id == tenant_id,
-        UsageRecord.resource_type == "processing",
-        UsageRecord.unit == "minutes",
-        UsageRecord.recorded_at >= current_month_start
-    ).scalar() or 0
-    
-    # Convert to minutes if stored in seconds
-    used_minutes = used_minutes / 60 if used_minutes > 0 else 0
-    
+
+    # Serve the monthly total from the short-TTL cache when fresh; the
+    # job queue invalidates it when it records new usage
+    used_minutes = _get_cached_processing_minutes(tenant_id)
+    if used_minutes is None:
+        # Calculate used processing time. The month start stays a bound
+        # parameter (stable within a month) so the statement shape - and
+        # its compiled-cache entry and query plan - never changes.
+        current_month_start = _current_month_start()
+
+        # Processing usage is stored canonically in seconds (see the job
+        # queue's _record_usage and migration 04), so the sum converts
+        # with one unconditional division instead of guessing per row
+        used_seconds = db.scalar(
+            select(func.coalesce(func.sum(UsageRecord.amount), 0)).where(
+                UsageRecord.tenant_id == tenant_id,
+                UsageRecord.resource_type == "processing",
+                UsageRecord.unit == "seconds",
+                UsageRecord.recorded_at >= current_month_start
+            )
+        )
+
+        used_minutes = used_seconds / 60.0
+        _cache_processing_minutes(tenant_id, used_minutes)
+
     return {
         "quota_minutes": tenant.processing_quota_minutes,
         "used_minutes": round(used_minutes, 2),
@@ -0,0 +1,55 @@
+-- Performance indexes for hot query paths
+
+-- Reseller name search uses ILIKE '%...%', which a btree index cannot
+-- serve. A trigram GIN index lets PostgreSQL answer leading-wildcard
+-- patterns with an index scan instead of a full table scan.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS resellers_name_trgm_idx ON resellers USING gin (name gin_trgm_ops);
+
+-- Demoting the previous default branding configuration filters on
+-- WHERE reseller_id = ? AND is_default = true. This partial index keeps
+-- that lookup to a single-row index scan, and its UNIQUE form enforces
+-- the one-default-per-reseller invariant against concurrent writers.
+CREATE UNIQUE INDEX IF NOT EXISTS branding_one_default_per_reseller_idx
+    ON branding_configurations (reseller_id) WHERE is_default = true;
+
+-- Composite indexes matching the list-endpoint filter shapes, so
+-- tenant-scoped listings stay proportional to page size instead of
+-- table size. The jobs index ends on created_at DESC to serve the
+-- default ordering (and keyset cursors) without a sort step.
+CREATE INDEX IF NOT EXISTS ix_jobs_tenant_user_created
+    ON jobs (tenant_id, user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_jobs_tenant_status
+    ON jobs (tenant_id, status);
+CREATE INDEX IF NOT EXISTS ix_workflows_tenant_template
+    ON workflows (tenant_id, is_template) WHERE is_template;
+CREATE INDEX IF NOT EXISTS ix_tenants_reseller
+    ON tenants (reseller_id);
+
+-- Tenant name search is ILIKE '%...%', same leading-wildcard shape as
+-- the reseller search above, so it gets the same trigram treatment.
+CREATE INDEX IF NOT EXISTS ix_tenants_name_trgm
+    ON tenants USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_workflows_name_trgm
+    ON workflows USING gin (name gin_trgm_ops);
+
+-- Anchored prefix searches (name_prefix query param) can use a plain
+-- btree with text_pattern_ops instead of the trigram index.
+CREATE INDEX IF NOT EXISTS ix_tenants_name_btree
+    ON tenants (name text_pattern_ops);
+CREATE INDEX IF NOT EXISTS ix_workflows_name_btree
+    ON workflows (name text_pattern_ops);
+
+-- The generic tenant-scoped listing helper orders by primary key and
+-- supports id-keyset pagination; these composite indexes let that read
+-- run as an index range scan instead of a filtered seq scan plus sort.
+CREATE INDEX IF NOT EXISTS ix_jobs_tenant_id_id
+    ON jobs (tenant_id, id);
+CREATE INDEX IF NOT EXISTS ix_workflows_tenant_id_id
+    ON workflows (tenant_id, id);
+
+-- The monthly processing-quota aggregate filters on tenant, resource
+-- type and a month-start lower bound; this composite index turns that
+-- SUM into a range scan over the month's rows only.
+CREATE INDEX IF NOT EXISTS ix_usage_tenant_time
+    ON usage_records (tenant_id, resource_type, recorded_at);
@@ -0,0 +1,12 @@
+-- Canonicalize processing usage to seconds.
+--
+-- The job queue records processing usage in seconds, but historical
+-- rows may carry unit = 'minutes'. The quota aggregate filters on a
+-- single unit and divides once, which silently drops rows in the other
+-- unit; converting everything to seconds makes the sum exact and keeps
+-- the hot-path arithmetic to one division.
+UPDATE usage_records
+SET amount = amount * 60,
+    unit = 'seconds'
+WHERE resource_type = 'processing'
+  AND unit = 'minutes';
@@ -0,0 +1,61 @@
+-- Race-free processing-quota enforcement at the insert path.
+--
+-- The application-side quota check is a read followed by an insert, so
+-- two concurrent jobs can both observe "under quota" and overshoot.
+-- This migration keeps an atomically maintained monthly rollup and
+-- rejects the insert that would cross the tenant's quota, inside the
+-- inserting transaction. The API-side check remains a cheap advisory
+-- read; this is the authoritative guard.
+
+CREATE TABLE IF NOT EXISTS monthly_usage (
+    tenant_id UUID NOT NULL,
+    period CHAR(6) NOT NULL,           -- YYYYMM
+    resource_type TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    total BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tenant_id, period, resource_type, unit)
+);
+
+CREATE OR REPLACE FUNCTION enforce_tenant_processing_quota()
+RETURNS trigger AS $$
+DECLARE
+    quota_minutes INTEGER;
+    new_total BIGINT;
+BEGIN
+    IF NEW.resource_type <> 'processing' OR NEW.unit <> 'seconds' THEN
+        RETURN NEW;
+    END IF;
+
+    -- Upsert the rollup row; the row lock taken here serializes
+    -- concurrent inserts for the same tenant and period
+    INSERT INTO monthly_usage (tenant_id, period, resource_type, unit, total)
+    VALUES (
+        NEW.tenant_id,
+        to_char(now(), 'YYYYMM'),
+        NEW.resource_type,
+        NEW.unit,
+        NEW.amount
+    )
+    ON CONFLICT (tenant_id, period, resource_type, unit)
+    DO UPDATE SET total = monthly_usage.total + EXCLUDED.total
+    RETURNING total INTO new_total;
+
+    SELECT processing_quota_minutes INTO quota_minutes
+    FROM tenants WHERE id = NEW.tenant_id;
+
+    IF quota_minutes IS NOT NULL
+       AND quota_minutes > 0
+       AND new_total > quota_minutes * 60 THEN
+        RAISE EXCEPTION 'processing quota exceeded for tenant %', NEW.tenant_id
+            USING ERRCODE = 'check_violation';
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_enforce_processing_quota ON usage_records;
+CREATE TRIGGER trg_enforce_processing_quota
+    BEFORE INSERT ON usage_records
+    FOR EACH ROW
+    EXECUTE FUNCTION enforce_tenant_processing_quota();
@@ -0,0 +1,35 @@
+-- Canonicalize user emails to lowercase.
+--
+-- The auth endpoints lowercase emails before comparing and store new
+-- registrations lowercased, but rows created before that change keep
+-- their original casing: those users can no longer log in (the lookup
+-- is an exact match against the lowercased input), and re-registering
+-- the lowercased form would create a duplicate account under the
+-- case-sensitive UNIQUE (tenant_id, email) constraint.
+
+-- First resolve case-insensitive duplicates within a tenant: the oldest
+-- account keeps the canonical address, later ones get a distinct
+-- suffixed address. Suffixing instead of deleting keeps rows other
+-- tables reference (jobs, workflows) intact and auditable.
+UPDATE users u
+SET email = LOWER(u.email) || '+dup-' || u.id
+WHERE EXISTS (
+    SELECT 1
+    FROM users d
+    WHERE d.tenant_id = u.tenant_id
+      AND d.id <> u.id
+      AND LOWER(d.email) = LOWER(u.email)
+      AND (d.created_at < u.created_at
+           OR (d.created_at = u.created_at AND d.id < u.id))
+);
+
+-- Now the lowercased form is unique per tenant; canonicalize the rest
+UPDATE users
+SET email = LOWER(email)
+WHERE email <> LOWER(email);
+
+-- Functional unique index: keeps future writes case-insensitively
+-- unique even if a non-canonical value slips past the application, and
+-- serves lookups on LOWER(email)
+CREATE UNIQUE INDEX IF NOT EXISTS users_tenant_lower_email_idx
+    ON users (tenant_id, LOWER(email));